@@ -0,0 +1,38 @@
+"""Time solve_bfs on growing mazes to check that it scales linearly with the cell count
+
+Usage: python benchmarks/bfs_scaling.py [--sizes 100 500 1000 2000 4000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_engine import Maze
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 1000, 2000, 4000])
+    parser.add_argument('--extra-paths', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'cells':>12} {'generate s':>11} {'bfs s':>9} {'ns/cell':>9}")
+    for size in args.sizes:
+        maze = Maze(size, seed=args.seed)
+        start = time.perf_counter()
+        maze.generate(extra_paths=args.extra_paths)
+        generated = time.perf_counter() - start
+
+        start = time.perf_counter()
+        maze.solve_bfs(show=False)
+        solved = time.perf_counter() - start
+
+        cells = size * size
+        print(f"{size:>6} {cells:>12} {generated:>11.3f} {solved:>9.3f} {solved / cells * 1e9:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
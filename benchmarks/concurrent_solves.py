@@ -0,0 +1,69 @@
+"""Stress-test concurrent solves of one shared MazeTopology from a thread pool
+
+Random (algorithm, start, goal) requests are first answered one at a time,
+then all of them again from --threads threads at once, --rounds times. Every
+concurrent answer must match its sequential path and cost; any mismatch is
+printed and the exit status is 1.
+
+Usage: python benchmarks/concurrent_solves.py [--size 200] [--threads 16] [--requests 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_engine import SOLVERS, Maze
+from maze_topology import MazeTopology
+
+
+def answer(topology, request):
+    algorithm, start, goal = request
+    path, stats = topology.solve(algorithm, start=start, goal=goal)
+    return path, stats.path_cost
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=200)
+    parser.add_argument('--extra-paths', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    maze = Maze(args.size, seed=args.seed)
+    maze.generate(extra_paths=args.extra_paths)
+    topology = MazeTopology.from_maze(maze)
+
+    chooser = random.Random(args.seed)
+    cells = lambda: (chooser.randrange(args.size), chooser.randrange(args.size))
+    requests = [(chooser.choice(list(SOLVERS)), cells(), cells()) for _ in range(args.requests)]
+
+    start = time.perf_counter()
+    expected = [answer(topology, request) for request in requests]
+    sequential = time.perf_counter() - start
+    print(f"sequential: {len(requests)} requests in {sequential:.3f}s")
+
+    failures = 0
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        for round_number in range(args.rounds):
+            start = time.perf_counter()
+            results = list(executor.map(lambda request: answer(topology, request), requests))
+            elapsed = time.perf_counter() - start
+            for request, result, wanted in zip(requests, results, expected):
+                if result != wanted:
+                    failures += 1
+                    print(f"mismatch in round {round_number}: {request}")
+            print(f"round {round_number}: {len(requests)} requests on {args.threads} threads in {elapsed:.3f}s")
+
+    print('ok' if not failures else f"{failures} mismatches")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Check JunctionGraph.solve against the cell solvers on connected and split mazes
+
+Each random maze is solved from random starts to random goals both on its
+junction graph and cell by cell; paths must agree on whether the goal is
+reachable, on length for BFS and on cost for UCS and ASTAR. Some mazes get
+walls closed with set_wall so they fall apart into components, and a 4x4
+maze of two separate 2x2 rings covers loops without any junction. Any
+mismatch is printed and the exit status is 1.
+
+Usage: python benchmarks/contract_check.py [--size 30] [--mazes 20] [--queries 50]
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_contract import ALGORITHMS, JunctionGraph
+from maze_engine import Maze
+
+
+def two_rings():
+    """4x4 maze whose only passages are two 2x2 rings, top-left and bottom-right"""
+    maze = Maze(4, seed=0)
+    for left, top in ((0, 0), (2, 2)):
+        maze.set_wall(left, top, 'right')
+        maze.set_wall(left, top, 'down')
+        maze.set_wall(left + 1, top + 1, 'left')
+        maze.set_wall(left + 1, top + 1, 'up')
+    return maze
+
+
+def split(maze, rng, walls):
+    """Close up to walls random open walls so the maze falls apart"""
+    size = maze.maze_size
+    for _ in range(walls):
+        x, y = rng.randrange(size), rng.randrange(size)
+        direction = rng.choice(('left', 'right', 'up', 'down'))
+        try:
+            maze.set_wall(x, y, direction, is_open=False)
+        except ValueError:
+            pass
+
+
+def check(maze, start, goal, graph):
+    """Mismatch messages for every algorithm on one query"""
+    expected = maze.solve('BFS', start=start, goal=goal)
+    cheapest = maze.solve('UCS', start=start, goal=goal)
+    problems = []
+    for algorithm in ALGORITHMS:
+        path = graph.solve(algorithm, start=start, goal=goal)
+        if bool(path) != bool(expected):
+            problems.append(f"{algorithm} {start}->{goal}: found={bool(path)}, cell search found={bool(expected)}")
+        elif algorithm == 'BFS' and len(path) != len(expected):
+            problems.append(f"BFS {start}->{goal}: {len(path)} cells, cell search {len(expected)}")
+        elif algorithm in ('UCS', 'ASTAR') and path and maze.path_cost(path) != maze.path_cost(cheapest):
+            problems.append(f"{algorithm} {start}->{goal}: cost {maze.path_cost(path)}, cell search {maze.path_cost(cheapest)}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=30)
+    parser.add_argument('--mazes', type=int, default=20)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    problems = []
+    rings = two_rings()
+    graph = JunctionGraph(rings)
+    for start, goal in (((0, 0), (3, 3)), ((3, 3), (0, 0)), ((0, 0), (1, 1)), ((1, 0), (2, 3))):
+        problems += check(rings, start, goal, graph)
+
+    for number in range(args.mazes):
+        maze = Maze(args.size, seed=args.seed + number)
+        maze.generate(extra_paths=rng.choice((0, args.size, args.size * 4)))
+        if number % 2:
+            split(maze, rng, args.size)
+        graph = JunctionGraph(maze)
+        cells = lambda: (rng.randrange(args.size), rng.randrange(args.size))
+        for _ in range(args.queries):
+            problems += check(maze, cells(), cells(), graph)
+
+    for problem in problems:
+        print(problem)
+    print('ok' if not problems else f"{len(problems)} mismatches")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main()
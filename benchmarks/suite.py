@@ -0,0 +1,132 @@
+"""Time every generator and solver over a sweep of maze sizes, loop counts and cost mixes
+
+Each combination of size, extra paths, cost-2 probability and engine is
+generated once per repeat with the same seed, then solved with every
+algorithm; the fastest repeat is reported. Results go to stdout or --out
+as JSON (with the Python version and platform) or CSV. With --baseline, a
+previous JSON run, rows that got slower by more than --tolerance are
+listed and the exit status is 1.
+
+Usage: python benchmarks/suite.py [--sizes 10 100 1000] [--extra-paths 0 100]
+       [--cost-probabilities 0.3] [--engines backtracker] [--algorithms BFS UCS]
+       [--repeat 3] [--format json|csv] [--out results.json] [--baseline old.json]
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_engine import COST_PROBABILITY, GENERATORS, SOLVERS, Maze
+
+# Columns identifying one measurement; the rest are results
+KEY_FIELDS = ('engine', 'size', 'extra_paths', 'cost_probability', 'phase')
+FIELDS = KEY_FIELDS + (
+    'seed', 'seconds', 'expanded', 'generated', 'peak_frontier', 'path_length', 'path_cost',
+)
+
+
+def measure(size, extra_paths, cost_probability, engine, algorithms, seed, repeat):
+    """Rows for generating one maze and solving it with each algorithm, best of repeat runs"""
+    best = {}
+    for _ in range(repeat):
+        maze = Maze(size, seed=seed, cost_probability=cost_probability)
+        start = time.perf_counter()
+        maze.generate(extra_paths=extra_paths, engine=engine)
+        rows = [{'phase': 'generate', 'seconds': time.perf_counter() - start}]
+
+        for algorithm in algorithms:
+            maze.reset()
+            maze.solve(algorithm)
+            stats = maze.stats[algorithm]
+            rows.append({
+                'phase': algorithm,
+                'seconds': stats.seconds,
+                'expanded': stats.expanded,
+                'generated': stats.generated,
+                'peak_frontier': stats.peak_frontier,
+                'path_length': stats.path_length,
+                'path_cost': stats.path_cost,
+            })
+
+        for row in rows:
+            if row['phase'] not in best or row['seconds'] < best[row['phase']]['seconds']:
+                best[row['phase']] = row
+
+    common = {'engine': engine, 'size': size, 'extra_paths': extra_paths,
+              'cost_probability': cost_probability, 'seed': seed}
+    return [{field: {**common, **row}.get(field) for field in FIELDS} for row in best.values()]
+
+
+def regressions(results, baseline, tolerance):
+    """(row, baseline seconds) for every row more than tolerance slower than the baseline"""
+    previous = {tuple(row[field] for field in KEY_FIELDS): row['seconds'] for row in baseline}
+    slower = []
+    for row in results:
+        before = previous.get(tuple(row[field] for field in KEY_FIELDS))
+        if before is not None and row['seconds'] > before * (1 + tolerance):
+            slower.append((row, before))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--extra-paths', type=int, nargs='+', default=[0, 100])
+    parser.add_argument('--cost-probabilities', type=float, nargs='+', default=[COST_PROBABILITY])
+    parser.add_argument('--engines', nargs='+', choices=sorted(GENERATORS), default=list(GENERATORS))
+    parser.add_argument('--algorithms', nargs='+', choices=sorted(SOLVERS), default=list(SOLVERS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--format', choices=('json', 'csv'), default='json')
+    parser.add_argument('--out', help="file to write results to instead of stdout")
+    parser.add_argument('--baseline', help="JSON results of an earlier run to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed slowdown, 0.2 is 20%%")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        for extra_paths in args.extra_paths:
+            for cost_probability in args.cost_probabilities:
+                for engine in args.engines:
+                    rows = measure(size, extra_paths, cost_probability, engine,
+                                   args.algorithms, args.seed, args.repeat)
+                    for row in rows:
+                        print(f"{engine:>12} {size:>6} {extra_paths:>7} {cost_probability:>5} "
+                              f"{row['phase']:>9} {row['seconds']:>9.4f}", file=sys.stderr)
+                    results.extend(rows)
+
+    output = open(args.out, 'w', newline='') if args.out else sys.stdout
+    try:
+        if args.format == 'json':
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results,
+            }, output, indent=1)
+            output.write('\n')
+        else:
+            writer = csv.DictWriter(output, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+    finally:
+        if args.out:
+            output.close()
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+        slower = regressions(results, baseline, args.tolerance)
+        for row, before in slower:
+            print(f"slower: {' '.join(str(row[field]) for field in KEY_FIELDS)} "
+                  f"{before:.4f}s -> {row['seconds']:.4f}s", file=sys.stderr)
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Time UCS view frames with per-cell SysFont lookups against MazeRenderer's label cache
+
+Runs headless through SDL's dummy video driver.
+Usage: python benchmarks/ucs_frame_time.py [--size 30] [--frames 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from maze_engine import Maze
+from maze_renderer import BLACK, MazeRenderer
+
+
+def uncached_labels(screen, maze, cost_map):
+    """The old per-frame label drawing: one SysFont lookup and render per cell"""
+    cell_size = maze.cell_size
+    for (x, y), cost in cost_map.items():
+        font = pygame.font.SysFont(None, 24)
+        text = font.render(str(cost), True, BLACK)
+        screen.blit(text, text.get_rect(center=(x * cell_size + cell_size // 2, y * cell_size + cell_size // 2)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=30)
+    parser.add_argument('--frames', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((700, 700))
+    maze = Maze(args.size, max(1, 700 // args.size), seed=args.seed)
+    maze.generate(extra_paths=8)
+    _, cost_map = maze.solve_ucs(show=False)
+    renderer = MazeRenderer(screen)
+    # Warm the static layers so both timings only measure per-frame work
+    renderer.show(maze, True, cost_map=cost_map, algorithm='UCS')
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        renderer.show(maze, True, algorithm='UCS')
+        uncached_labels(screen, maze, cost_map)
+    before = (time.perf_counter() - start) / args.frames
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        renderer.show(maze, True, cost_map=cost_map, algorithm='UCS')
+    after = (time.perf_counter() - start) / args.frames
+
+    print(f"{len(cost_map)} labels per frame")
+    print(f"per-cell SysFont: {before * 1000:8.2f} ms/frame")
+    print(f"label cache:      {after * 1000:8.2f} ms/frame")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Time MazeViewport frames on a large maze at every zoom level, cold and with warm tiles
+
+Runs headless through SDL's dummy video driver.
+Usage: python benchmarks/viewport_frame_time.py [--size 2000] [--frames 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from maze_engine import Maze
+from maze_renderer import ZOOM_LEVELS, MazeViewport
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=2000)
+    parser.add_argument('--frames', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((700, 700))
+    maze = Maze(args.size, seed=args.seed)
+    maze.generate(extra_paths=args.size)
+    path = maze.solve('BFS')
+    viewport = MazeViewport(screen, maze)
+    viewport.show_visited()
+    viewport.set_overlay('path', path)
+
+    print(f"{'zoom':>5} {'first frame ms':>15} {'warm frame ms':>14} {'scrolling ms':>13}")
+    for zoom in ZOOM_LEVELS:
+        viewport.zoom = zoom
+        viewport.left = viewport.top = 0
+        start = time.perf_counter()
+        viewport.draw()
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            viewport.draw()
+        warm = (time.perf_counter() - start) / args.frames
+
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            viewport.scroll(7, 5)
+            viewport.draw()
+        scrolling = (time.perf_counter() - start) / args.frames
+        print(f"{zoom:>5} {first * 1000:>15.1f} {warm * 1000:>14.2f} {scrolling * 1000:>13.2f}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
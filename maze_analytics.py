@@ -0,0 +1,93 @@
+"""Structural statistics of a maze in linear time, for checking generated mazes cheaply
+
+Per-cell counts come from bytes.translate and bytes.count over the wall
+buffer, so they run at C speed; only the component labelling and the two
+diameter sweeps walk the cells in Python, each visiting every cell once.
+"""
+from array import array
+from collections import deque
+
+from maze_engine import DEGREE
+
+
+def _sweep(maze, source, labels, label, steps):
+    """BFS from source over cells still labelled -1, labelling them label
+
+    steps receives each reached cell's distance from source. Returns
+    (farthest cell, its distance in steps, cells reached).
+    """
+    openings = maze.openings
+    moves = maze.moves()
+    steps[source] = 0
+    labels[source] = label
+    queue = deque([source])
+    farthest, reached = source, 0
+    while queue:
+        current = queue.popleft()
+        reached += 1
+        if steps[current] > steps[farthest]:
+            farthest = current
+        walls = openings[current]
+        for bit, offset in moves:
+            if walls & bit and labels[current + offset] < 0:
+                labels[current + offset] = label
+                steps[current + offset] = steps[current] + 1
+                queue.append(current + offset)
+    return farthest, steps[farthest], reached
+
+
+def analyze(maze):
+    """Return a dict of structural statistics for maze
+
+    components   number of connected components (1 for a fully connected maze)
+    largest      cells in the largest component
+    passages     open walls, each counted once
+    cycles       independent loops, passages - cells + components; 0 for a perfect maze
+    dead_ends    cells with exactly one opening
+    degrees      histogram of openings per cell, index 0 to 4
+    costs        {cost: number of cells}
+    diameter     double-sweep BFS lower bound on the longest shortest path in
+                 the largest component, in steps (exact when it has no cycles)
+    diameter_ends  the two (x, y) cells that bound diameter
+    corners_connected  whether (0, 0) and the bottom-right corner are connected
+    """
+    size = maze.maze_size
+    cells = size * size
+    degrees = bytes(maze.openings).translate(DEGREE)
+    histogram = [degrees.count(degree) for degree in range(5)]
+    passages = sum(degree * count for degree, count in enumerate(histogram)) // 2
+    costs = bytes(maze.costs)
+
+    labels = array('i', [-1]) * cells
+    # Shared by every component's sweep: each cell is reached exactly once
+    steps = array('i', [0]) * cells
+    sizes = []
+    component_starts = []
+    cell = 0
+    while cell < cells:
+        if labels[cell] < 0:
+            _, _, reached = _sweep(maze, cell, labels, len(sizes), steps)
+            sizes.append(reached)
+            component_starts.append(cell)
+        cell += 1
+
+    diameter, ends = 0, None
+    if sizes:
+        largest = max(range(len(sizes)), key=sizes.__getitem__)
+        first, _, _ = _sweep(maze, component_starts[largest], array('i', [-1]) * cells, 0, steps)
+        second, diameter, _ = _sweep(maze, first, array('i', [-1]) * cells, 0, steps)
+        ends = [(first % size, first // size), (second % size, second // size)]
+
+    return {
+        'cells': cells,
+        'components': len(sizes),
+        'largest': max(sizes, default=0),
+        'passages': passages,
+        'cycles': passages - cells + len(sizes),
+        'dead_ends': histogram[1],
+        'degrees': histogram,
+        'costs': {cost: costs.count(cost) for cost in sorted(set(costs))},
+        'diameter': diameter,
+        'diameter_ends': ends,
+        'corners_connected': bool(cells) and labels[0] == labels[cells - 1],
+    }
@@ -0,0 +1,69 @@
+"""Solve many mazes with several algorithms across a pool of worker processes"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from maze_engine import SOLVERS, Maze
+
+# Jobs kept in flight per worker, so results stream back without queueing every maze at once
+JOBS_PER_WORKER = 4
+
+
+def _solve_buffers(index, maze_size, openings, costs, algorithms, keep_paths):
+    """Worker entry point: rebuild the maze from its buffers and run every algorithm on it"""
+    maze = Maze(maze_size, openings=bytearray(openings), costs=costs)
+    results = {}
+    for algorithm in algorithms:
+        maze.reset()
+        path = maze.solve(algorithm)
+        results[algorithm] = maze.stats[algorithm].as_dict()
+        results[algorithm]['visited'] = maze.visited_count()
+        if keep_paths:
+            results[algorithm]['path'] = path
+    return index, results
+
+
+def solve_batch(mazes, algorithms=('DFS', 'BFS', 'UCS'), workers=None, keep_paths=False):
+    """Solve every maze with every algorithm and yield (index, results) as mazes finish
+
+    mazes is any iterable of Maze objects; index is the maze's position in it.
+    results maps each algorithm to its SearchStats as a dict plus the visited
+    cell count (and the path itself with keep_paths).
+    Only the compact wall and cost buffers are sent to the workers. Results
+    arrive in completion order, not input order. workers=0 solves in this
+    process, which avoids the pool start-up cost for small batches.
+    """
+    for algorithm in algorithms:
+        if algorithm not in SOLVERS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+    algorithms = tuple(algorithms)
+
+    if workers == 0:
+        for index, maze in enumerate(mazes):
+            yield _solve_buffers(index, *maze.to_buffers(), algorithms, keep_paths)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for index, maze in enumerate(mazes):
+            pending.add(executor.submit(_solve_buffers, index, *maze.to_buffers(), algorithms, keep_paths))
+            if len(pending) >= workers * JOBS_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def summarize(results):
+    """Total seconds and visited cells per algorithm over (index, results) pairs"""
+    totals = {}
+    for _, per_algorithm in results:
+        for algorithm, result in per_algorithm.items():
+            total = totals.setdefault(algorithm, {'mazes': 0, 'seconds': 0.0, 'visited': 0})
+            total['mazes'] += 1
+            total['seconds'] += result['seconds']
+            total['visited'] += result['visited']
+    return totals
@@ -0,0 +1,93 @@
+"""Content-addressed cache of solver results, in memory with optional on-disk storage"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+from maze_engine import SearchStats
+
+# Part of every cache key; bump it whenever the entry layout changes so older entries are never served
+SCHEMA_VERSION = 2
+# Fields every current entry has
+ENTRY_FIELDS = frozenset(SearchStats.__slots__).union({'visited', 'path'}) - {'_clock', '_memory'}
+
+
+class SolutionCache:
+    """LRU cache of solutions keyed by maze content, algorithm, endpoints and solver options
+
+    Entries are the original solve's SearchStats as a dict (expansion counts,
+    path cost, seconds and so on) plus the number of visited cells and the
+    path itself as a list of (x, y). With a directory every entry is also
+    written there as JSON, so later processes can reuse it.
+    """
+
+    def __init__(self, capacity=256, directory=None):
+        self.capacity = capacity
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(maze, algorithm, start=(0, 0), goal=None, **options):
+        """Cache key for solving maze with algorithm between start and goal"""
+        if goal is None:
+            goal = (maze.maze_size - 1, maze.maze_size - 1)
+        description = json.dumps(
+            [SCHEMA_VERSION, maze.content_hash(), algorithm, list(start), list(goal), sorted(options.items())]
+        )
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key):
+        """Return the cached entry for key or None, checking memory before disk"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        elif self.directory is not None and os.path.exists(self._file(key)):
+            with open(self._file(key)) as file:
+                entry = json.load(file)
+            if ENTRY_FIELDS <= entry.keys():
+                entry['path'] = [tuple(cell) for cell in entry['path']]
+                self._remember(key, entry)
+            else:
+                # Written in another layout; solve again and overwrite it
+                entry = None
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        self._remember(key, entry)
+        if self.directory is not None:
+            # Write then rename so readers never see a half-written entry
+            temporary = f'{self._file(key)}.{os.getpid()}.tmp'
+            with open(temporary, 'w') as file:
+                json.dump(entry, file)
+            os.replace(temporary, self._file(key))
+
+    def _remember(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def solve(self, maze, algorithm, **options):
+        """Return the cached entry for this solve, running the solver only on a miss"""
+        key = self.key(maze, algorithm, **options)
+        entry = self.get(key)
+        if entry is None:
+            maze.reset()
+            path = maze.solve(algorithm, **options)
+            entry = maze.stats[algorithm].as_dict()
+            entry['visited'] = maze.visited_count()
+            entry['path'] = path
+            self.put(key, entry)
+        return entry
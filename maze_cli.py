@@ -0,0 +1,195 @@
+"""Generate and solve mazes from the command line, without the GUI
+
+    python maze_cli.py generate --size 2000 --seed 7 --out m.bin
+    python maze_cli.py solve m.bin --algo bfs,ucs --stats
+    python maze_cli.py generate --size 100000 --tile-size 256 --out huge.bin
+    python maze_cli.py analyze m.bin
+
+Every result is written to stdout as one JSON object per line, flushed as
+soon as it is known, so output can be piped or tailed while a long batch
+runs. solve and analyze tell tiled maze files (see maze_tiles) from plain
+ones by their magic. Only the headless modules are imported; pygame never is.
+"""
+import argparse
+import json
+import sys
+import time
+
+from maze_analytics import analyze
+from maze_engine import COST_PROBABILITY, GENERATORS, SOLVERS, Maze
+from maze_io import load_maze, save_maze
+from maze_tiles import ALGORITHMS as TILED_ALGORITHMS
+from maze_tiles import DEFAULT_CAPACITY, TiledMaze, generate_tiled, is_tiled
+
+# Largest tiled maze analyze copies into memory by default, about 2 GiB of working state
+ANALYZE_MAX_SIZE = 10000
+
+
+def emit(record):
+    sys.stdout.write(json.dumps(record) + '\n')
+    sys.stdout.flush()
+
+
+def cell(text):
+    """Parse an 'x,y' argument into an (x, y) tuple"""
+    try:
+        x, y = text.split(',')
+        return int(x), int(y)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected x,y but got {text!r}")
+
+
+def algorithms(text):
+    """Parse a comma-separated, case-insensitive list of SOLVERS keys"""
+    names = [name.strip().upper() for name in text.split(',') if name.strip()]
+    for name in names:
+        if name not in SOLVERS:
+            raise argparse.ArgumentTypeError(f"unknown algorithm {name!r}, choose from {', '.join(SOLVERS)}")
+    return names
+
+
+def generate(args):
+    if args.tile_size:
+        return generate_tiles(args)
+    start = time.perf_counter()
+    maze = Maze(args.size, seed=args.seed, cost_probability=args.cost_probability)
+    maze.generate(extra_paths=args.extra_paths, engine=args.engine)
+    generated = time.perf_counter() - start
+    save_maze(maze, args.out)
+    emit({
+        'command': 'generate',
+        'out': args.out,
+        'size': args.size,
+        'seed': args.seed,
+        'engine': args.engine,
+        'extra_paths': args.extra_paths,
+        'seconds': generated,
+        'hash': maze.content_hash(),
+    })
+
+
+def generate_tiles(args):
+    start = time.perf_counter()
+    generate_tiled(args.out, args.size, args.tile_size, seed=args.seed, loops=args.loops,
+                   cost_probability=args.cost_probability)
+    emit({
+        'command': 'generate',
+        'out': args.out,
+        'size': args.size,
+        'seed': args.seed,
+        'engine': 'eller',
+        'tile_size': args.tile_size,
+        'loops': args.loops,
+        'seconds': time.perf_counter() - start,
+    })
+
+
+def solve(args):
+    if is_tiled(args.maze):
+        return solve_tiles(args)
+    maze = load_maze(args.maze)
+    for algorithm in args.algo:
+        maze.reset()
+        path = maze.solve(algorithm, start=args.start, goal=args.goal)
+        record = {
+            'command': 'solve',
+            'maze': args.maze,
+            'algorithm': algorithm,
+            'found': bool(path),
+            'path_length': len(path),
+            'path_cost': maze.path_cost(path) if path else None,
+        }
+        if args.stats:
+            record.update(maze.stats[algorithm].as_dict())
+            record['visited'] = maze.visited_count()
+        if args.path:
+            record['path'] = path
+        emit(record)
+
+
+def analyze_maze(args):
+    start = time.perf_counter()
+    record = {'command': 'analyze', 'maze': args.maze}
+    if is_tiled(args.maze):
+        # Analytics label every cell, so a tiled maze is copied into memory whole
+        with TiledMaze(args.maze, capacity=args.tiles) as tiled:
+            if tiled.maze_size > args.max_size:
+                raise ValueError(f"{args.maze} is {tiled.maze_size}x{tiled.maze_size}, larger than --max-size "
+                                 f"{args.max_size}; analytics need the whole maze in memory")
+            maze = tiled.to_maze()
+    else:
+        maze = load_maze(args.maze)
+    record.update(analyze(maze))
+    record['seconds'] = time.perf_counter() - start
+    emit(record)
+
+
+def solve_tiles(args):
+    for algorithm in args.algo:
+        if algorithm not in TILED_ALGORITHMS:
+            raise ValueError(f"Tiled mazes can only be solved with {', '.join(TILED_ALGORITHMS)}")
+    with TiledMaze(args.maze, capacity=args.tiles) as maze:
+        for algorithm in args.algo:
+            # The tile counters run for as long as the file is open; report this solve's share
+            loads, evictions = maze.loads, maze.evictions
+            path = maze.solve(algorithm, start=args.start, goal=args.goal)
+            stats = maze.stats[algorithm]
+            record = {
+                'command': 'solve',
+                'maze': args.maze,
+                'algorithm': algorithm,
+                'found': bool(path),
+                'path_length': stats.path_length,
+                'path_cost': stats.path_cost,
+            }
+            if args.stats:
+                record.update(stats.as_dict())
+                record.update(tile_loads=maze.loads - loads, tile_evictions=maze.evictions - evictions)
+            if args.path:
+                record['path'] = path
+            emit(record)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    generating = commands.add_parser('generate', help="generate a maze and save it in the binary maze format")
+    generating.add_argument('--size', type=int, required=True)
+    generating.add_argument('--seed', type=int)
+    generating.add_argument('--engine', choices=sorted(GENERATORS), default='backtracker')
+    generating.add_argument('--extra-paths', type=int, default=5)
+    generating.add_argument('--cost-probability', type=float, default=COST_PROBABILITY)
+    generating.add_argument('--out', required=True)
+    generating.add_argument('--tile-size', type=int,
+                            help="stream a tiled maze with Eller's algorithm instead, for grids larger than memory")
+    generating.add_argument('--loops', type=float, default=0.0,
+                            help="with --tile-size, chance of opening a wall that closes a loop")
+    generating.set_defaults(run=generate)
+
+    solving = commands.add_parser('solve', help="solve a saved maze with one or more algorithms")
+    solving.add_argument('maze')
+    solving.add_argument('--algo', type=algorithms, default=['BFS'], help="comma-separated, e.g. bfs,ucs")
+    solving.add_argument('--start', type=cell, default=(0, 0), help="x,y (default 0,0)")
+    solving.add_argument('--goal', type=cell, help="x,y (default the bottom-right corner)")
+    solving.add_argument('--stats', action='store_true', help="include search counters and timings")
+    solving.add_argument('--path', action='store_true', help="include the path cells")
+    solving.add_argument('--tiles', type=int, default=DEFAULT_CAPACITY, help="resident tiles for tiled mazes")
+    solving.set_defaults(run=solve)
+
+    analyzing = commands.add_parser('analyze', help="report components, loops, dead ends and diameter of a saved maze")
+    analyzing.add_argument('maze')
+    analyzing.add_argument('--max-size', type=int, default=ANALYZE_MAX_SIZE,
+                           help="largest tiled maze side to load into memory for analysis")
+    analyzing.add_argument('--tiles', type=int, default=DEFAULT_CAPACITY, help="resident tiles while loading a tiled maze")
+    analyzing.set_defaults(run=analyze_maze)
+
+    args = parser.parse_args(argv)
+    try:
+        args.run(args)
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"{parser.prog}: error: {error}\n")
+
+
+if __name__ == '__main__':
+    main()
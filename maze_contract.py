@@ -0,0 +1,237 @@
+"""Contract a maze into a junction graph for faster repeated searches
+
+Dead-end subtrees are pruned first; every pruned cell remembers the
+direction back towards the rest of the maze. The remaining cells with
+other than two open neighbors become graph nodes, and each corridor
+between two of them becomes one weighted edge.
+"""
+import heapq
+from collections import defaultdict
+
+from maze_engine import DEGREE, OPPOSITE
+
+# Algorithms JunctionGraph.solve understands. BFS minimizes cells stepped through, UCS and ASTAR cost
+ALGORITHMS = ('DFS', 'BFS', 'UCS', 'ASTAR')
+
+
+class JunctionGraph:
+    """Junction graph of a maze; solve() searches it and expands the answer into cells
+
+    Edges are (target node, cost, hops, direction leaving the node), where
+    cost sums Cell.cost over the cells entered and hops counts them. Cells
+    in keep always stay nodes and are never pruned.
+    """
+
+    def __init__(self, maze, keep=()):
+        self.maze = maze
+        size = maze.maze_size
+        keep = {y * size + x for x, y in keep}
+        self._prune(keep)
+
+        self.is_node = bytearray(size * size)
+        for cell in range(size * size):
+            if not self.pruned[cell] and (self.degree[cell] != 2 or cell in keep):
+                self.is_node[cell] = 1
+
+        self.edges = {}
+        self.edge_count = 0
+        openings = maze.openings
+        for node in self._nodes():
+            node_edges = []
+            walls = openings[node]
+            for bit, offset in maze.moves():
+                if walls & bit and not self.pruned[node + offset]:
+                    target, cost, hops, _ = self._walk(node, bit)
+                    # A corridor looping back to its own node never shortens a path
+                    if target != node:
+                        node_edges.append((target, cost, hops, bit))
+            self.edges[node] = node_edges
+            self.edge_count += len(node_edges)
+        self.node_count = len(self.edges)
+        # Nodes settled by the most recent solve(), for comparing against cell searches
+        self.expanded = 0
+
+    def _prune(self, keep):
+        """Strip dead ends repeatedly until only loops, junctions and kept cells remain"""
+        maze = self.maze
+        size = maze.maze_size
+        openings = maze.openings
+        moves = maze.moves()
+        self.degree = degree = bytearray(bytes(openings).translate(DEGREE))
+        self.pruned = pruned = bytearray(size * size)
+        # Direction from a pruned cell back towards the unpruned core, 0 for the root of a pruned tree
+        self.exit_direction = exit_direction = bytearray(size * size)
+
+        stack = [cell for cell in range(size * size) if degree[cell] <= 1 and cell not in keep]
+        while stack:
+            cell = stack.pop()
+            if pruned[cell]:
+                continue
+            pruned[cell] = 1
+            walls = openings[cell]
+            for bit, offset in moves:
+                following = cell + offset
+                if walls & bit and not pruned[following]:
+                    exit_direction[cell] = bit
+                    degree[following] -= 1
+                    if degree[following] <= 1 and following not in keep:
+                        stack.append(following)
+            degree[cell] = 0
+
+    def _nodes(self):
+        is_node = self.is_node
+        node = is_node.find(1)
+        while node != -1:
+            yield node
+            node = is_node.find(1, node + 1)
+
+    def _walk(self, cell, bit, stop=-1, cells=None):
+        """Follow the corridor leaving cell through bit until a node or stop is reached
+
+        Returns (end cell, cost, hops, direction the end was entered by) and
+        appends every cell stepped into to cells when a list is given. A
+        corridor that closes on cell without meeting a node or stop is a
+        loop with no junctions; for such a loop None is returned instead.
+        """
+        maze = self.maze
+        openings, costs, pruned, is_node = maze.openings, maze.costs, self.pruned, self.is_node
+        moves = maze.moves()
+        previous, current = cell, cell + maze.offsets[bit]
+        cost, hops, entered = costs[current], 1, bit
+        if cells is not None:
+            cells.append(current)
+
+        while not is_node[current] and current != stop:
+            if current == cell:
+                return None
+            walls = openings[current]
+            for step, offset in moves:
+                following = current + offset
+                if walls & step and following != previous and not pruned[following]:
+                    break
+            previous, current, entered = current, following, step
+            cost += costs[current]
+            hops += 1
+            if cells is not None:
+                cells.append(current)
+        return current, cost, hops, entered
+
+    def _tail(self, cell):
+        """Cells from cell up its pruned subtree to the first unpruned cell (or the tree's root)"""
+        tail = [cell]
+        while self.pruned[cell] and self.exit_direction[cell]:
+            cell += self.maze.offsets[self.exit_direction[cell]]
+            tail.append(cell)
+        return tail
+
+    def _attach(self, cell, other, extra, blocked):
+        """Join an unpruned corridor cell to the graph with temporary edges in extra
+
+        The corridor edges that run through cell are added to blocked, so a
+        search cannot pass through it without stopping there.
+        """
+        if self.is_node[cell]:
+            return
+        costs = self.maze.costs
+        walls = self.maze.openings[cell]
+        for bit, offset in self.maze.moves():
+            if walls & bit and not self.pruned[cell + offset]:
+                walk = self._walk(cell, bit, stop=other)
+                if walk is None:
+                    # cell sits on a junction-free loop that other is not on
+                    return
+                end, cost, hops, entered = walk
+                extra[cell].append((end, cost, hops, bit))
+                extra[end].append((cell, cost - costs[end] + costs[cell], hops, OPPOSITE[entered]))
+                blocked.add((end, OPPOSITE[entered]))
+
+    def solve(self, algorithm='UCS', start=(0, 0), goal=None):
+        """Search the junction graph and return the full cell path from start to goal"""
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        maze = self.maze
+        size = maze.maze_size
+        start, goal = maze.endpoints(start, goal)
+        self.expanded = 0
+
+        start_tail, goal_tail = self._tail(start), self._tail(goal)
+        # Both ends hang off the same pruned subtree: the tree path is the only path
+        goal_positions = {cell: index for index, cell in enumerate(goal_tail)}
+        for index, cell in enumerate(start_tail):
+            if cell in goal_positions:
+                cells = start_tail[:index + 1] + goal_tail[:goal_positions[cell]][::-1]
+                return [(cell % size, cell // size) for cell in cells]
+        source, target = start_tail[-1], goal_tail[-1]
+        if self.pruned[source] or self.pruned[target]:
+            return []
+
+        extra = defaultdict(list)
+        blocked = set()
+        self._attach(source, target, extra, blocked)
+        self._attach(target, source, extra, blocked)
+        parent = self._search(algorithm, source, target, extra, blocked)
+        if target not in parent:
+            return []
+
+        # Expand each graph edge back into the corridor cells it stands for
+        legs = []
+        node = target
+        while node != source:
+            previous, bit = parent[node]
+            legs.append((previous, bit, node))
+            node = previous
+        cells = list(start_tail)
+        for previous, bit, node in reversed(legs):
+            self._walk(previous, bit, stop=node, cells=cells)
+        cells += goal_tail[-2::-1]
+        return [(cell % size, cell // size) for cell in cells]
+
+    def _neighbors(self, node, extra, blocked):
+        """Graph edges out of node plus temporary ones, minus corridors through attached cells"""
+        if blocked:
+            return [edge for edge in self.edges.get(node, []) if (node, edge[3]) not in blocked] + extra.get(node, [])
+        return self.edges.get(node, []) + extra.get(node, [])
+
+    def _search(self, algorithm, source, target, extra, blocked):
+        """Search nodes from source to target; returns {node: (previous node, direction)}"""
+        parent = {source: None}
+
+        if algorithm == 'DFS':
+            stack = [source]
+            while stack:
+                node = stack.pop()
+                self.expanded += 1
+                if node == target:
+                    break
+                for following, _, _, bit in self._neighbors(node, extra, blocked):
+                    if following not in parent:
+                        parent[following] = (node, bit)
+                        stack.append(following)
+            return parent
+
+        size = self.maze.maze_size
+        target_x, target_y = target % size, target // size
+        # BFS minimizes hops; every step costs at least one, so Manhattan distance is admissible for A*
+        weight = 2 if algorithm == 'BFS' else 1
+        distance = {source: 0}
+        settled = set()
+        queue = [(0, source)]
+        while queue:
+            _, node = heapq.heappop(queue)
+            if node in settled:
+                continue
+            settled.add(node)
+            self.expanded += 1
+            if node == target:
+                break
+            for edge in self._neighbors(node, extra, blocked):
+                following = edge[0]
+                new_distance = distance[node] + edge[weight]
+                if following not in distance or new_distance < distance[following]:
+                    distance[following] = new_distance
+                    parent[following] = (node, edge[3])
+                    estimate = 0
+                    if algorithm == 'ASTAR':
+                        estimate = abs(target_x - following % size) + abs(target_y - following // size)
+                    heapq.heappush(queue, (new_distance + estimate, following))
+        return parent
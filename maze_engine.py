@@ -0,0 +1,882 @@
+import random
+import heapq
+import hashlib
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from typing import NamedTuple, Optional
+
+UPDATE_TIME_MS = 250
+
+# Wall bitmask: one byte per cell, a set bit means the wall on that side is open
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+
+DIRECTIONS = {'left': LEFT, 'right': RIGHT, 'up': UP, 'down': DOWN}
+OPPOSITE = {LEFT: RIGHT, RIGHT: LEFT, UP: DOWN, DOWN: UP}
+# (bit, dx, dy) in the order neighbors are examined
+MOVES = ((LEFT, -1, 0), (RIGHT, 1, 0), (UP, 0, -1), (DOWN, 0, 1))
+
+# Maze.generate engines and the methods implementing them
+GENERATORS = {
+    'backtracker': '_generate_backtracker',
+    'kruskal': '_generate_kruskal',
+    'binary_tree': '_generate_binary_tree',
+    'sidewinder': '_generate_sidewinder',
+    'wilson': '_generate_wilson',
+}
+
+# Solver method for each algorithm key used in Maze.path
+SOLVERS = {
+    'DFS': 'solve_dfs',
+    'BFS': 'solve_bfs',
+    'UCS': 'solve_ucs',
+    'ASTAR': 'solve_astar',
+    'BIDIR': 'solve_bidirectional',
+}
+
+# Step-by-step generator for each algorithm key, yielding SearchEvents
+SEARCHES = {
+    'DFS': 'iter_dfs',
+    'BFS': 'iter_bfs',
+    'UCS': 'iter_ucs',
+    'ASTAR': 'iter_astar',
+    'BIDIR': 'iter_bidirectional',
+}
+
+# Chance that Maze.__init__ makes a cell cost 2 instead of 1
+COST_PROBABILITY = 0.3
+
+# Larger than any path cost a maze can hold
+INFINITE_COST = 2 ** 31 - 1
+
+# Number of openings for every possible wall byte
+DEGREE = bytes(bin(bits).count('1') for bits in range(256))
+
+
+class SearchEvent(NamedTuple):
+    """One search step: algorithm reached cell, at cost when it is a cost-aware search"""
+    algorithm: str
+    cell: tuple
+    cost: Optional[int] = None
+
+
+class SearchStats:
+    """Counters from one search, stored in Maze.stats under its algorithm key
+
+    expanded counts cells taken off the frontier (for DFS, cells the first
+    time they top the stack), generated counts cells put on it and
+    peak_frontier is the most it held at once. seconds is wall time from the
+    first step to the last, so it includes drawing when the search is
+    animated. peak_memory is how far traced memory rose above its level at
+    the start, in bytes, measured only while tracemalloc is tracing (start it
+    or run python -X tracemalloc). The process-wide peak is never reset, so
+    when it predates the search only the net growth by the end is reported,
+    and searches running at the same time see each other's allocations.
+    """
+
+    __slots__ = (
+        'algorithm', 'expanded', 'generated', 'peak_frontier',
+        'path_length', 'path_cost', 'seconds', 'peak_memory', '_clock', '_memory',
+    )
+
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.expanded = 0
+        self.generated = 0
+        self.peak_frontier = 0
+        self.path_length = 0
+        self.path_cost = None
+        self.seconds = 0.0
+        self.peak_memory = None
+        self._clock = time.perf_counter()
+        self._memory = None
+        if tracemalloc.is_tracing():
+            # (current, peak) baseline; reset_peak() would disturb other searches and the caller
+            self._memory = tracemalloc.get_traced_memory()
+
+    def finish(self, expanded, generated, peak_frontier, path_length, path_cost):
+        """Record the final counters and stop the clock and memory measurement"""
+        self.seconds = time.perf_counter() - self._clock
+        self.expanded = expanded
+        self.generated = generated
+        self.peak_frontier = peak_frontier
+        self.path_length = path_length
+        self.path_cost = path_cost
+        if self._memory is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            start, start_peak = self._memory
+            self.peak_memory = (peak if peak > start_peak else current) - start
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith('_')}
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={value!r}' for name, value in self.as_dict().items())
+        return f'SearchStats({fields})'
+
+
+class HeapQueue:
+    """Binary-heap priority queue of (cost, cell) entries"""
+
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, cost, cell):
+        heapq.heappush(self.heap, (cost, cell))
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+
+class BucketQueue:
+    """Monotone priority queue for small integer step costs (Dial's algorithm)
+
+    Every queued cost lies within max_step of the last popped one, so a ring
+    of max_step + 1 buckets indexed by cost is enough and push/pop are O(1).
+    """
+
+    def __init__(self, max_step):
+        self.buckets = [[] for _ in range(max_step + 1)]
+        self.cost = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, cost, cell):
+        self.buckets[cost % len(self.buckets)].append(cell)
+        self.size += 1
+
+    def pop(self):
+        bucket = self.buckets[self.cost % len(self.buckets)]
+        while not bucket:
+            self.cost += 1
+            bucket = self.buckets[self.cost % len(self.buckets)]
+        self.size -= 1
+        return self.cost, bucket.pop()
+
+
+# Maze class and generation logic
+class Cell:
+    """View of one cell over the flat buffers of a Maze"""
+
+    __slots__ = ('maze', 'index')
+
+    def __init__(self, maze, index):
+        self.maze = maze
+        self.index = index
+
+    @property
+    def neighbor(self):
+        """Directions ('left', 'right', 'up', 'down') that are open from this cell"""
+        openings = self.maze.openings[self.index]
+        return [name for name, bit in DIRECTIONS.items() if openings & bit]
+
+    @property
+    def visited(self):
+        return self.maze.is_visited(self.index)
+
+    @visited.setter
+    def visited(self, value):
+        self.maze.marks[self.index] = self.maze.epoch if value else 0
+
+    @property
+    def cost(self):
+        return self.maze.costs[self.index]
+
+    def set_neighbor(self, neighbor):
+        """Open the wall towards the given direction"""
+        self.maze.openings[self.index] |= DIRECTIONS[neighbor]
+
+    def set_visited(self):
+        """Mark the cell as visited"""
+        self.maze.marks[self.index] = self.maze.epoch
+
+    def get_neighbor(self):
+        """Get the list of neighboring cells"""
+        return self.neighbor
+
+    def get_visited(self):
+        """Check if the cell has been visited"""
+        return self.visited
+
+    def get_cost(self):
+        return self.cost
+
+class Maze:
+    def __init__(self, maze_size, cell_size=1, renderer=None, seed=None, openings=None, costs=None,
+                 cost_probability=COST_PROBABILITY):
+        self.maze_size = maze_size
+        self.cell_size = cell_size
+        # Optional MazeRenderer; solvers only draw their steps when one is attached
+        self.renderer = renderer
+        # Every random choice goes through this generator so a seed reproduces the maze
+        self.random = random.Random(seed)
+        # Parallel flat buffers indexed by y * maze_size + x
+        self.openings = bytearray(maze_size * maze_size) if openings is None else openings
+        # Flat index step for each direction bit
+        self.offsets = {LEFT: -1, RIGHT: 1, UP: -maze_size, DOWN: maze_size}
+        if costs is None:
+            costs = bytearray(
+                2 if self.random.random() < cost_probability else 1 for _ in range(maze_size * maze_size)
+            )
+        self.costs = costs
+        # A cell counts as visited while its mark equals the current epoch, so reset() is O(1)
+        self.marks = bytearray(maze_size * maze_size)
+        self.epoch = 1
+        self.path = {algorithm: [] for algorithm in SOLVERS}
+        # SearchStats of the latest run of each algorithm
+        self.stats = {algorithm: None for algorithm in SOLVERS}
+        # Optional profiling hook: run_search calls profile(event, seconds) with the time each step took
+        self.profile = None
+        # Callables told about edits: set_wall and set_cost call each with the (x, y) cells they changed
+        self.watchers = []
+
+    @classmethod
+    def from_buffers(cls, maze_size, openings, costs, cell_size=1, renderer=None):
+        """Build a maze from copies of wall and cost buffers of maze_size * maze_size bytes"""
+        if len(openings) != maze_size * maze_size or len(costs) != maze_size * maze_size:
+            raise ValueError(f"Buffers do not match a {maze_size}x{maze_size} maze")
+        return cls(maze_size, cell_size, renderer, openings=bytearray(openings), costs=bytearray(costs))
+
+    def to_buffers(self):
+        """Return (maze_size, openings, costs) as immutable bytes, cheap to pickle"""
+        return self.maze_size, bytes(self.openings), bytes(self.costs)
+
+    def content_hash(self):
+        """Hex digest identifying this maze by its size, walls and costs"""
+        digest = hashlib.sha256(self.maze_size.to_bytes(8, 'little'))
+        digest.update(self.openings)
+        digest.update(self.costs)
+        return digest.hexdigest()
+
+    def solve(self, algorithm, **options):
+        """Run the solver for an algorithm key and return just its path"""
+        result = getattr(self, SOLVERS[algorithm])(show=False, **options)
+        return result[0] if isinstance(result, tuple) else result
+
+    def path_cost(self, path):
+        """Sum of the costs of every cell entered along path"""
+        return sum(self.costs[y * self.maze_size + x] for x, y in path[1:])
+
+    def at(self, x, y):
+        return Cell(self, y * self.maze_size + x)
+
+    def set_wall(self, x, y, direction, is_open=True):
+        """Open or close the wall on one side ('left', 'right', 'up', 'down') of cell (x, y)"""
+        bit = DIRECTIONS[direction]
+        dx, dy = next((dx, dy) for moved, dx, dy in MOVES if moved == bit)
+        nx, ny = x + dx, y + dy
+        for cx, cy in ((x, y), (nx, ny)):
+            if not (0 <= cx < self.maze_size and 0 <= cy < self.maze_size):
+                raise ValueError(f"Cell ({cx}, {cy}) is outside the {self.maze_size}x{self.maze_size} maze")
+        cell, following = y * self.maze_size + x, ny * self.maze_size + nx
+        if is_open:
+            self.openings[cell] |= bit
+            self.openings[following] |= OPPOSITE[bit]
+        else:
+            self.openings[cell] &= ~bit
+            self.openings[following] &= ~OPPOSITE[bit]
+        for watcher in self.watchers:
+            watcher([(x, y), (nx, ny)])
+
+    def set_cost(self, x, y, cost):
+        """Change the cost of entering cell (x, y); costs are bytes of at least 1"""
+        if not 1 <= cost <= 255:
+            raise ValueError(f"Cell cost must be between 1 and 255, got {cost}")
+        if not (0 <= x < self.maze_size and 0 <= y < self.maze_size):
+            raise ValueError(f"Cell ({x}, {y}) is outside the {self.maze_size}x{self.maze_size} maze")
+        self.costs[y * self.maze_size + x] = cost
+        for watcher in self.watchers:
+            watcher([(x, y)])
+
+    def is_visited(self, index):
+        return self.marks[index] == self.epoch
+
+    def visited_count(self):
+        """Number of cells visited since the last reset()"""
+        return self.marks.count(self.epoch)
+
+    def generate(self, extra_paths=5, engine='backtracker', seed=None):
+        """Carve a spanning tree of passages, then open extra_paths random walls
+
+        engine is one of GENERATORS. Passing seed reseeds self.random first,
+        so the same seed and engine always carve the same walls. Only the
+        walls: cell costs were drawn by __init__, so reproducing them too
+        takes Maze(..., seed=).
+        """
+        if engine not in GENERATORS:
+            raise ValueError(f"Unknown generator engine: {engine}")
+        if seed is not None:
+            self.random.seed(seed)
+
+        self.openings[:] = bytes(len(self.openings))
+        getattr(self, GENERATORS[engine])()
+
+        # Add extra paths to allow multiple solutions
+        for _ in range(extra_paths):
+            self._add_random_connection()
+
+    def _carve(self, cell, direction):
+        """Open the wall between cell and its neighbor in the given direction"""
+        following = cell + self.offsets[direction]
+        self.openings[cell] |= direction
+        self.openings[following] |= OPPOSITE[direction]
+
+    def _generate_backtracker(self):
+        size = self.maze_size
+        openings = self.openings
+        offsets = self.offsets
+        generated = bytearray(size * size)
+
+        # Start from a random cell
+        x = self.random.randint(0, size - 1)
+        y = self.random.randint(0, size - 1)
+        current = y * size + x
+        stack = [current]
+        generated[current] = 1
+        visited = 1
+
+        # Generate the single-solution maze
+        while visited < size * size:
+            current = stack[-1]
+            x = current % size
+
+            neighbor = []
+
+            if x > 0 and not generated[current - 1]:
+                neighbor.append(LEFT)
+            if x < size - 1 and not generated[current + 1]:
+                neighbor.append(RIGHT)
+            if current >= size and not generated[current - size]:
+                neighbor.append(UP)
+            if current < size * (size - 1) and not generated[current + size]:
+                neighbor.append(DOWN)
+
+            if neighbor:
+                direction = self.random.choice(neighbor)
+                following = current + offsets[direction]
+                openings[current] |= direction
+                openings[following] |= OPPOSITE[direction]
+                generated[following] = 1
+                stack.append(following)
+                visited += 1
+            else:
+                stack.pop()
+
+    def _generate_kruskal(self):
+        """Randomized Kruskal: join cells over shuffled walls with a union-find
+
+        Every wall costs a shuffle step and two root lookups in Python, so
+        this is slower than the backtracker (about 0.2-0.3M against 0.4M
+        cells/s in benchmarks/generators.py); binary_tree and sidewinder are
+        the fast engines.
+        """
+        size = self.maze_size
+        openings = self.openings
+        # Wall ids are cell * 2 for the wall to the right and cell * 2 + 1 for the one below
+        walls = [cell * 2 for cell in range(size * size) if cell % size < size - 1]
+        walls += [cell * 2 + 1 for cell in range(size * (size - 1))]
+        self.random.shuffle(walls)
+        root = array('i', range(size * size))
+        remaining = size * size - 1
+
+        for wall in walls:
+            if not remaining:
+                break
+            cell = wall >> 1
+            following = cell + (size if wall & 1 else 1)
+
+            # Find both roots with path halving
+            a = cell
+            while root[a] != a:
+                root[a] = root[root[a]]
+                a = root[a]
+            b = following
+            while root[b] != b:
+                root[b] = root[root[b]]
+                b = root[b]
+
+            if a != b:
+                root[a] = b
+                remaining -= 1
+                if wall & 1:
+                    openings[cell] |= DOWN
+                    openings[following] |= UP
+                else:
+                    openings[cell] |= RIGHT
+                    openings[following] |= LEFT
+
+    def _generate_binary_tree(self):
+        """Binary tree: every cell opens up or left, one row at a time"""
+        size = self.maze_size
+        for y in range(size):
+            # One random bit per cell decides between up and left
+            bits = self.random.getrandbits(size)
+            for x in range(size):
+                cell = y * size + x
+                if y == 0 and x == 0:
+                    continue
+                if y == 0 or (x > 0 and bits >> x & 1):
+                    self._carve(cell, LEFT)
+                else:
+                    self._carve(cell, UP)
+
+    def _generate_sidewinder(self):
+        """Sidewinder: carve runs along each row and open one upward passage per run"""
+        size = self.maze_size
+        for x in range(size - 1):
+            self._carve(x, RIGHT)
+        for y in range(1, size):
+            run_start = 0
+            for x in range(size):
+                cell = y * size + x
+                if x == size - 1 or self.random.getrandbits(1):
+                    self._carve(y * size + self.random.randint(run_start, x), UP)
+                    run_start = x + 1
+                else:
+                    self._carve(cell, RIGHT)
+
+    def _generate_wilson(self):
+        """Wilson's algorithm: loop-erased random walks give a uniform spanning tree"""
+        size = self.maze_size
+        offsets = self.offsets
+        choice = self.random.choice
+        # Directions that stay on the grid, looked up by each cell's border mask
+        options = {mask: tuple(bit for bit in (LEFT, RIGHT, UP, DOWN) if mask & bit) for mask in range(16)}
+        inside = bytearray(
+            (LEFT if x > 0 else 0) | (RIGHT if x < size - 1 else 0) | (UP if y > 0 else 0) | (DOWN if y < size - 1 else 0)
+            for y in range(size) for x in range(size)
+        )
+        in_tree = bytearray(size * size)
+        # Direction bit last taken out of each cell; overwriting it erases loops
+        exit_direction = bytearray(size * size)
+        in_tree[self.random.randrange(size * size)] = 1
+
+        for start in range(size * size):
+            if in_tree[start]:
+                continue
+            current = start
+            while not in_tree[current]:
+                bit = choice(options[inside[current]])
+                exit_direction[current] = bit
+                current += offsets[bit]
+
+            # Retrace the loop-erased walk and add it to the tree
+            current = start
+            while not in_tree[current]:
+                in_tree[current] = 1
+                bit = exit_direction[current]
+                self._carve(current, bit)
+                current += offsets[bit]
+
+    def _add_random_connection(self):
+        x, y = self.random.randint(0, self.maze_size - 1), self.random.randint(0, self.maze_size - 1)
+        directions = [
+            (bit, x + dx, y + dy) for bit, dx, dy in MOVES
+            if 0 <= x + dx < self.maze_size and 0 <= y + dy < self.maze_size
+        ]
+
+        if directions:
+            direction, nx, ny = self.random.choice(directions)
+            # OR-ing the bits keeps an already open wall from being counted twice
+            self.openings[y * self.maze_size + x] |= direction
+            self.openings[ny * self.maze_size + nx] |= OPPOSITE[direction]
+
+# -------------- Search stepping Functions ----------------
+
+    def run_search(self, search, show=False, delay=UPDATE_TIME_MS, show_visited=True):
+        """Drive a search generator to the end and return its result
+
+        Every iter_* solver yields one SearchEvent per step and returns what
+        the matching solve_* method returns. With show=True each event is
+        handed to the attached renderer; otherwise nothing is drawn.
+        """
+        draw = show and self.renderer is not None
+        profile = self.profile
+        cost_map = {}
+        while True:
+            if profile is not None:
+                began = time.perf_counter()
+            try:
+                event = next(search)
+            except StopIteration as stop:
+                return stop.value
+            if profile is not None:
+                profile(event, time.perf_counter() - began)
+            if draw:
+                if event.cost is not None:
+                    cost_map[event.cell] = event.cost
+                self.renderer.draw_step(self, event.algorithm, event.cell, show_visited, cost_map or None, delay)
+
+# -------------- Solving by DFS Functions ----------------
+
+    def solve_dfs(self, show: bool = True, delay: int = 10, show_visited: bool = True, start=(0, 0), goal=None):
+        return self.run_search(self.iter_dfs(start, goal), show, delay, show_visited)
+
+    def iter_dfs(self, start=(0, 0), goal=None):
+
+        stats = SearchStats('DFS')
+        size = self.maze_size
+        openings = self.openings
+        marks, epoch = self.marks, self.epoch
+        start, goal = self.endpoints(start, goal)
+        moves = self.moves()
+        # Search-local, so other searches on this maze cannot disturb it
+        seen = bytearray(size * size)
+        # The stack only ever holds the current route from the start, one cell per step
+        stack: list[int] = [start]
+        seen[start] = 1
+        marks[start] = epoch
+        expanded, generated, peak_frontier = 0, 1, 1
+        # A cell counts as expanded when it first tops the stack, not on each return to it
+        backtracked = False
+
+        while stack and stack[-1] != goal:
+            current: int = stack[-1]
+            walls: int = openings[current]
+            if not backtracked:
+                expanded += 1
+            backtracked = False
+
+            for bit, offset in moves:
+                if walls & bit and not seen[current + offset]:
+                    seen[current + offset] = 1
+                    marks[current + offset] = epoch
+                    stack.append(current + offset)
+                    generated += 1
+                    if len(stack) > peak_frontier:
+                        peak_frontier = len(stack)
+                    break
+            else:
+                # Dead end: backtrack
+                stack.pop()
+                backtracked = True
+
+            yield SearchEvent('DFS', (current % size, current // size))
+
+        path = [(cell % size, cell // size) for cell in stack]
+        self.path['DFS'] = path
+        self._finish_stats(stats, path, expanded, generated, peak_frontier)
+
+        return path
+
+# -------------- Solving by BFS Functions ----------------
+
+    def solve_bfs(self, show=True, delay=UPDATE_TIME_MS, show_visited=True, start=(0, 0), goal=None):
+        return self.run_search(self.iter_bfs(start, goal), show, delay, show_visited)
+
+    def iter_bfs(self, start=(0, 0), goal=None):
+        stats = SearchStats('BFS')
+        size = self.maze_size
+        openings = self.openings
+        marks, epoch = self.marks, self.epoch
+        start, goal = self.endpoints(start, goal)
+        # Cells are flat y * size + x ids; parent[i] is the id we reached i from
+        parent = array('i', [-1]) * (size * size)
+        seen = bytearray(size * size)
+        queue = deque([start])
+        seen[start] = 1
+        marks[start] = epoch
+        moves = self.moves()
+        expanded, generated, peak_frontier = 0, 1, 1
+
+        while queue:
+            if len(queue) > peak_frontier:
+                peak_frontier = len(queue)
+            current = queue.popleft()
+            expanded += 1
+
+            if current == goal:
+                path = self._trace_parents(parent, start, goal)
+                self.path['BFS'] = path
+                self._finish_stats(stats, path, expanded, generated, peak_frontier)
+                return path
+
+            walls = openings[current]
+            for bit, offset in moves:
+                if not walls & bit:
+                    continue
+                following = current + offset
+
+                if not seen[following]:
+                    seen[following] = 1
+                    marks[following] = epoch
+                    parent[following] = current
+                    queue.append(following)
+                    generated += 1
+
+                    yield SearchEvent('BFS', (following % size, following // size))
+
+        self._finish_stats(stats, [], expanded, generated, peak_frontier)
+        return []
+
+    def endpoints(self, start, goal):
+        """Flat ids for an (x, y) start and goal; goal defaults to the bottom-right corner"""
+        if goal is None:
+            goal = (self.maze_size - 1, self.maze_size - 1)
+        for x, y in (start, goal):
+            if not (0 <= x < self.maze_size and 0 <= y < self.maze_size):
+                raise ValueError(f"Cell ({x}, {y}) is outside the {self.maze_size}x{self.maze_size} maze")
+        return start[1] * self.maze_size + start[0], goal[1] * self.maze_size + goal[0]
+
+    def moves(self):
+        """(bit, index offset) pairs; the wall bits keep every offset inside the grid"""
+        return ((LEFT, -1), (RIGHT, 1), (UP, -self.maze_size), (DOWN, self.maze_size))
+
+    def _trace_parents(self, parent, start, goal):
+        """Walk a parent array back from goal to start and return the (x, y) path"""
+        size = self.maze_size
+        path = []
+        current = goal
+        while current != start:
+            path.append((current % size, current // size))
+            current = parent[current]
+        path.append((start % size, start // size))
+        path.reverse()
+        return path
+
+    def _finish_stats(self, stats, path, expanded, generated, peak_frontier):
+        """Fill in stats once a search ends and store them in self.stats"""
+        stats.finish(expanded, generated, peak_frontier, len(path), self.path_cost(path) if path else None)
+        self.stats[stats.algorithm] = stats
+
+# -------------- Solving by UCS Functions ----------------
+
+    def solve_ucs(self, show=True, delay=UPDATE_TIME_MS, show_visited=True, queue='heap', start=(0, 0), goal=None):
+        return self.run_search(self.iter_ucs(queue, start, goal), show, delay, show_visited)
+
+    def iter_ucs(self, queue='heap', start=(0, 0), goal=None):
+        """Uniform cost search from start (top-left) to goal (bottom-right) by default
+
+        queue='heap' uses a binary heap; queue='bucket' uses a BucketQueue,
+        which is faster because cell costs are small integers. The returned
+        cost_map only holds settled (final) costs.
+        """
+        stats = SearchStats('UCS')
+        if queue == 'heap':
+            frontier = HeapQueue()
+        elif queue == 'bucket':
+            frontier = BucketQueue(max(self.costs))
+        else:
+            raise ValueError(f"Unknown queue: {queue}")
+
+        size = self.maze_size
+        openings = self.openings
+        costs = self.costs
+        marks, epoch = self.marks, self.epoch
+        start, goal = self.endpoints(start, goal)
+        moves = self.moves()
+        g = array('i', [INFINITE_COST]) * (size * size)
+        parent = array('i', [-1]) * (size * size)
+        settled = bytearray(size * size)
+        cost_map = {}
+        g[start] = 0
+        frontier.push(0, start)
+        expanded, generated, peak_frontier = 0, 1, 1
+
+        while frontier:
+            if len(frontier) > peak_frontier:
+                peak_frontier = len(frontier)
+            cost, current = frontier.pop()
+            # Cells can be queued several times; only the cheapest entry is expanded
+            if settled[current]:
+                continue
+            settled[current] = 1
+            marks[current] = epoch
+            expanded += 1
+            x, y = current % size, current // size
+            cost_map[(x, y)] = cost
+
+            if current == goal:
+                path = self._trace_parents(parent, start, goal)
+                self.path['UCS'] = path
+                self._finish_stats(stats, path, expanded, generated, peak_frontier)
+                return path, cost_map
+
+            walls = openings[current]
+            for bit, offset in moves:
+                if not walls & bit:
+                    continue
+                following = current + offset
+                new_cost = cost + costs[following]
+                if new_cost < g[following]:
+                    g[following] = new_cost
+                    parent[following] = current
+                    frontier.push(new_cost, following)
+                    generated += 1
+
+            yield SearchEvent('UCS', (x, y), cost)
+
+        self._finish_stats(stats, [], expanded, generated, peak_frontier)
+        return [], cost_map
+
+# -------------- Solving by A* Functions ----------------
+
+    def solve_astar(self, show=True, delay=UPDATE_TIME_MS, show_visited=True, heuristic='manhattan', start=(0, 0), goal=None):
+        return self.run_search(self.iter_astar(heuristic, start, goal), show, delay, show_visited)
+
+    def iter_astar(self, heuristic='manhattan', start=(0, 0), goal=None):
+        """A* from start to goal, by default from the top-left to the bottom-right corner
+
+        heuristic is 'manhattan' (every step costs at least 1) or 'cost', which
+        scales the Manhattan distance by the cheapest cell cost in the maze.
+        Both are admissible and consistent, so settled cells are never reopened.
+        """
+        stats = SearchStats('ASTAR')
+        if heuristic == 'manhattan':
+            scale = 1
+        elif heuristic == 'cost':
+            scale = min(self.costs)
+        else:
+            raise ValueError(f"Unknown heuristic: {heuristic}")
+
+        size = self.maze_size
+        openings = self.openings
+        costs = self.costs
+        marks, epoch = self.marks, self.epoch
+        start, goal = self.endpoints(start, goal)
+        goal_x, goal_y = goal % size, goal // size
+        moves = self.moves()
+        g = array('i', [INFINITE_COST]) * (size * size)
+        parent = array('i', [-1]) * (size * size)
+        settled = bytearray(size * size)
+        cost_map = {}
+        g[start] = 0
+        # Entries are (f, -g, cell); preferring deeper entries on ties keeps A* heading for the goal
+        priority_queue = [(scale * (abs(goal_x - start % size) + abs(goal_y - start // size)), 0, start)]
+        expanded, generated, peak_frontier = 0, 1, 1
+
+        while priority_queue:
+            if len(priority_queue) > peak_frontier:
+                peak_frontier = len(priority_queue)
+            _, negative_cost, current = heapq.heappop(priority_queue)
+            if settled[current]:
+                continue
+            settled[current] = 1
+            marks[current] = epoch
+            expanded += 1
+            x, y = current % size, current // size
+            cost_map[(x, y)] = -negative_cost
+
+            if current == goal:
+                path = self._trace_parents(parent, start, goal)
+                self.path['ASTAR'] = path
+                self._finish_stats(stats, path, expanded, generated, peak_frontier)
+                return path, cost_map
+
+            walls = openings[current]
+            for bit, offset in moves:
+                if not walls & bit:
+                    continue
+                following = current + offset
+                new_cost = g[current] + costs[following]
+                if new_cost < g[following]:
+                    g[following] = new_cost
+                    parent[following] = current
+                    estimate = scale * (abs(goal_x - following % size) + abs(goal_y - following // size))
+                    heapq.heappush(priority_queue, (new_cost + estimate, -new_cost, following))
+                    generated += 1
+
+            yield SearchEvent('ASTAR', (x, y), -negative_cost)
+
+        self._finish_stats(stats, [], expanded, generated, peak_frontier)
+        return [], cost_map
+
+# -------------- Solving by Bidirectional Search Functions ----------------
+
+    def solve_bidirectional(self, show=True, delay=UPDATE_TIME_MS, show_visited=True, weighted=True, start=(0, 0), goal=None):
+        return self.run_search(self.iter_bidirectional(weighted, start, goal), show, delay, show_visited)
+
+    def iter_bidirectional(self, weighted=True, start=(0, 0), goal=None):
+        """Search from start and goal at once and join the two trees where they meet
+
+        With weighted=True this is bidirectional Dijkstra over the cell costs;
+        with weighted=False every step costs 1, i.e. a bidirectional BFS.
+        """
+        stats = SearchStats('BIDIR')
+        size = self.maze_size
+        openings = self.openings
+        costs = self.costs if weighted else bytes([1]) * (size * size)
+        marks, epoch = self.marks, self.epoch
+        start, goal = self.endpoints(start, goal)
+        moves = self.moves()
+        # Index 0 is the forward search from the start, 1 the backward search from the goal
+        distance = (array('i', [INFINITE_COST]) * (size * size), array('i', [INFINITE_COST]) * (size * size))
+        parent = (array('i', [-1]) * (size * size), array('i', [-1]) * (size * size))
+        settled = (bytearray(size * size), bytearray(size * size))
+        queues = ([(0, start)], [(0, goal)])
+        distance[0][start] = 0
+        distance[1][goal] = 0
+        best, meeting = (0, start) if start == goal else (INFINITE_COST, -1)
+        cost_map = {}
+        expanded, generated, peak_frontier = 0, 2, 2
+
+        while queues[0] and queues[1]:
+            # Nothing left in either frontier can beat the best meeting found so far
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            if len(queues[0]) + len(queues[1]) > peak_frontier:
+                peak_frontier = len(queues[0]) + len(queues[1])
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            cost, current = heapq.heappop(queues[side])
+            if settled[side][current]:
+                continue
+            settled[side][current] = 1
+            marks[current] = epoch
+            expanded += 1
+            if side == 0:
+                cost_map[(current % size, current // size)] = cost
+
+            walls = openings[current]
+            for bit, offset in moves:
+                if not walls & bit:
+                    continue
+                following = current + offset
+                # Moving into a cell pays that cell's cost, so the backward search pays for current
+                new_cost = cost + (costs[following] if side == 0 else costs[current])
+                if new_cost < distance[side][following]:
+                    distance[side][following] = new_cost
+                    parent[side][following] = current
+                    heapq.heappush(queues[side], (new_cost, following))
+                    generated += 1
+                    total = new_cost + distance[1 - side][following]
+                    if total < best:
+                        best, meeting = total, following
+
+            # Backward costs are measured from the goal, so only forward steps report one
+            yield SearchEvent('BIDIR', (current % size, current // size), cost if side == 0 else None)
+
+        if meeting < 0:
+            self._finish_stats(stats, [], expanded, generated, peak_frontier)
+            return [], cost_map
+
+        forward = self._trace_parents(parent[0], start, meeting)
+        backward = self._trace_parents(parent[1], goal, meeting)
+        path = forward + backward[-2::-1]
+        self.path['BIDIR'] = path
+        # Report true costs from the start along the joined route
+        cost = 0
+        for x, y in path[1:]:
+            cost += costs[y * size + x]
+            cost_map[(x, y)] = cost
+        self._finish_stats(stats, path, expanded, generated, peak_frontier)
+        return path, cost_map
+
+    def reset(self):
+        """Forget which cells were visited by moving to a new epoch
+
+        Marks only need clearing, in place, once every 255 resets when the
+        byte-sized epoch wraps around.
+        """
+        self.epoch += 1
+        if self.epoch > 255:
+            self.marks[:] = bytes(len(self.marks))
+            self.epoch = 1
@@ -0,0 +1,233 @@
+"""Hierarchical path-finding index (HPA*-style) for repeated queries on large mazes
+
+The grid is cut into square clusters. Passages are one cell wide, so every
+open wall between two clusters is a door whose two cells become portals.
+For each cluster the cheapest cost between every pair of its portals is
+precomputed by a search that stays inside the cluster. A query links start
+and goal to the portals of their clusters, runs A* over portals only, then
+refines each abstract step back into cells by searching just that cluster.
+Because the abstract graph holds exact in-cluster costs, paths are optimal.
+"""
+import heapq
+import json
+
+from maze_engine import MOVES
+
+VERSION = 1
+DEFAULT_CLUSTER_SIZE = 32
+
+
+class ClusterIndex:
+    """Portals and in-cluster portal-to-portal costs of a maze, by cluster
+
+    portals maps cluster id to its portal cells and edges maps a portal to
+    [(other portal, cost)] within its cluster, with costs summing Cell.cost
+    over the cells entered. Cells and clusters are flat row-major ids.
+    """
+
+    def __init__(self, maze, cluster_size=DEFAULT_CLUSTER_SIZE, build=True):
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self.across = -(-maze.maze_size // cluster_size)
+        self.portals = {}
+        self.edges = {}
+        # Abstract nodes settled by the most recent query()
+        self.expanded = 0
+        if build:
+            for cluster in range(self.across * self.across):
+                self._build_cluster(cluster)
+
+    def cluster_of(self, cell):
+        size = self.maze.maze_size
+        return (cell // size // self.cluster_size) * self.across + cell % size // self.cluster_size
+
+    def _bounds(self, cluster):
+        """(x0, y0, x1, y1) of cluster, half-open"""
+        size, span = self.maze.maze_size, self.cluster_size
+        x0, y0 = cluster % self.across * span, cluster // self.across * span
+        return x0, y0, min(x0 + span, size), min(y0 + span, size)
+
+    def _find_portals(self, cluster):
+        """Cells of cluster with an open wall into another cluster"""
+        maze = self.maze
+        size, openings = maze.maze_size, maze.openings
+        x0, y0, x1, y1 = self._bounds(cluster)
+        portals = []
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                # Only border cells can have a wall on the cluster edge
+                if x0 < x < x1 - 1 and y0 < y < y1 - 1:
+                    continue
+                cell = y * size + x
+                for bit, offset in maze.moves():
+                    if openings[cell] & bit and self.cluster_of(cell + offset) != cluster:
+                        portals.append(cell)
+                        break
+        return portals
+
+    def _build_cluster(self, cluster):
+        """(Re)compute the portals of cluster and the costs between them"""
+        for portal in self.portals.get(cluster, ()):
+            self.edges.pop(portal, None)
+        portals = self._find_portals(cluster)
+        self.portals[cluster] = portals
+        for portal in portals:
+            distance, _ = self._local_search(portal, cluster, targets=set(portals))
+            self.edges[portal] = [(other, distance[other]) for other in portals if other != portal and other in distance]
+
+    def _local_search(self, source, cluster, targets=None, reverse=False):
+        """Dijkstra from source that never leaves cluster; returns (distance, parent) dicts
+
+        Stops once every cell in targets is settled. With reverse=True the
+        distances are costs of reaching source from each cell instead.
+        """
+        maze = self.maze
+        size, openings, costs = maze.maze_size, maze.openings, maze.costs
+        x0, y0, x1, y1 = self._bounds(cluster)
+        moves = maze.moves()
+        distance = {source: 0}
+        parent = {source: None}
+        settled = set()
+        remaining = len(targets) if targets else -1
+        queue = [(0, source)]
+        while queue and remaining:
+            cost, current = heapq.heappop(queue)
+            if current in settled:
+                continue
+            settled.add(current)
+            if targets and current in targets:
+                remaining -= 1
+            walls = openings[current]
+            for bit, offset in moves:
+                if not walls & bit:
+                    continue
+                following = current + offset
+                if not (x0 <= following % size < x1 and y0 <= following // size < y1):
+                    continue
+                new_cost = cost + (costs[current] if reverse else costs[following])
+                if new_cost < distance.get(following, new_cost + 1):
+                    distance[following] = new_cost
+                    parent[following] = current
+                    heapq.heappush(queue, (new_cost, following))
+        return distance, parent
+
+    def update(self, cells):
+        """Rebuild the clusters around cells after their walls or costs changed
+
+        A changed wall can add or remove a door, so the clusters of each
+        cell's neighbors are rebuilt as well. Registering it as a Maze watcher
+        (maze.watchers.append(index.update)) keeps the index in step with
+        set_wall and set_cost.
+        """
+        size = self.maze.maze_size
+        clusters = set()
+        for x, y in cells:
+            for _, dx, dy in ((0, 0, 0),) + MOVES:
+                if 0 <= x + dx < size and 0 <= y + dy < size:
+                    clusters.add(self.cluster_of((y + dy) * size + x + dx))
+        for cluster in clusters:
+            self._build_cluster(cluster)
+
+    def query(self, start=(0, 0), goal=None):
+        """Return (path, cost) of a cheapest path from start to goal, ([], None) if unreachable"""
+        maze = self.maze
+        size, openings, costs = maze.maze_size, maze.openings, maze.costs
+        start, goal = maze.endpoints(start, goal)
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+
+        # Temporary edges joining start and goal to the portals of their clusters
+        forward, _ = self._local_search(start, start_cluster)
+        start_edges = [(portal, forward[portal]) for portal in self.portals[start_cluster] if portal in forward]
+        if goal in forward:
+            start_edges.append((goal, forward[goal]))
+        backward, _ = self._local_search(goal, goal_cluster, reverse=True)
+        to_goal = {portal: backward[portal] for portal in self.portals[goal_cluster] if portal in backward}
+
+        goal_x, goal_y = goal % size, goal // size
+        distance = {start: 0}
+        parent = {start: None}
+        settled = set()
+        queue = [(abs(goal_x - start % size) + abs(goal_y - start // size), 0, start)]
+        self.expanded = 0
+        while queue:
+            _, cost, node = heapq.heappop(queue)
+            if node in settled:
+                continue
+            settled.add(node)
+            self.expanded += 1
+            if node == goal:
+                break
+            neighbors = list(self.edges.get(node, ()))
+            if node == start:
+                neighbors += start_edges
+            if node in to_goal:
+                neighbors.append((goal, to_goal[node]))
+            if node in self.edges:
+                # Doors out of a portal into the neighboring clusters
+                cluster = self.cluster_of(node)
+                for bit, offset in maze.moves():
+                    if openings[node] & bit and self.cluster_of(node + offset) != cluster:
+                        neighbors.append((node + offset, costs[node + offset]))
+            for following, step in neighbors:
+                new_cost = cost + step
+                if new_cost < distance.get(following, new_cost + 1):
+                    distance[following] = new_cost
+                    parent[following] = node
+                    estimate = abs(goal_x - following % size) + abs(goal_y - following // size)
+                    heapq.heappush(queue, (new_cost + estimate, new_cost, following))
+
+        if goal not in settled:
+            return [], None
+        nodes = [goal]
+        while parent[nodes[-1]] is not None:
+            nodes.append(parent[nodes[-1]])
+        nodes.reverse()
+        return self._refine(nodes), distance[goal]
+
+    def _refine(self, nodes):
+        """Expand consecutive abstract nodes into the cells between them"""
+        size = self.maze.maze_size
+        cells = [nodes[0]]
+        for previous, node in zip(nodes, nodes[1:]):
+            cluster = self.cluster_of(previous)
+            if self.cluster_of(node) != cluster:
+                # A door: the two cells are neighbors
+                cells.append(node)
+                continue
+            _, parent = self._local_search(previous, cluster, targets={node})
+            leg = [node]
+            while parent[leg[-1]] != previous:
+                leg.append(parent[leg[-1]])
+            cells.extend(reversed(leg))
+        return [(cell % size, cell // size) for cell in cells]
+
+    def to_dict(self):
+        """JSON-ready form of the index, tied to the maze by its content hash"""
+        return {
+            'version': VERSION,
+            'maze_hash': self.maze.content_hash(),
+            'cluster_size': self.cluster_size,
+            'portals': {str(cluster): portals for cluster, portals in self.portals.items()},
+            'edges': {str(portal): edges for portal, edges in self.edges.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, maze, data):
+        """Rebuild an index saved by to_dict for the same maze"""
+        if data.get('version') != VERSION:
+            raise ValueError(f"Unsupported cluster index version {data.get('version')}")
+        if data['maze_hash'] != maze.content_hash():
+            raise ValueError("Cluster index was built for a different maze")
+        index = cls(maze, data['cluster_size'], build=False)
+        index.portals = {int(cluster): portals for cluster, portals in data['portals'].items()}
+        index.edges = {int(portal): [tuple(edge) for edge in edges] for portal, edges in data['edges'].items()}
+        return index
+
+    def save(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, maze, path):
+        with open(path) as file:
+            return cls.from_dict(maze, json.load(file))
@@ -0,0 +1,110 @@
+"""Incremental shortest paths with Lifelong Planning A* (LPA*)
+
+An IncrementalSolver keeps its search state between queries. It watches
+its maze, so every Maze.set_wall or Maze.set_cost call marks just the
+edited cells for repair; the next path() only re-expands cells whose
+cost-to-reach actually changed, instead of searching the maze again.
+"""
+import heapq
+from array import array
+
+from maze_engine import INFINITE_COST
+
+
+class IncrementalSolver:
+    """Cheapest path between a fixed start and goal, repaired after maze edits
+
+    g holds each cell's settled cost from the start and rhs its one-step
+    lookahead (the cheapest neighbor's g plus the cell's own cost). Cells
+    where they differ are queued, keyed as in A* with the Manhattan
+    distance to the goal, which stays admissible because costs are >= 1.
+    """
+
+    def __init__(self, maze, start=(0, 0), goal=None):
+        self.maze = maze
+        self.start, self.goal = maze.endpoints(start, goal)
+        size = maze.maze_size
+        self.g = array('i', [INFINITE_COST]) * (size * size)
+        self.rhs = array('i', [INFINITE_COST]) * (size * size)
+        self.rhs[self.start] = 0
+        self.queue = [self._key(self.start) + (self.start,)]
+        # Cells expanded by the most recent path() call
+        self.expanded = 0
+        maze.watchers.append(self.cells_changed)
+
+    def close(self):
+        """Stop watching the maze for edits"""
+        self.maze.watchers.remove(self.cells_changed)
+
+    def _key(self, cell):
+        size = self.maze.maze_size
+        best = min(self.g[cell], self.rhs[cell])
+        goal = self.goal
+        return (best + abs(goal % size - cell % size) + abs(goal // size - cell // size), best)
+
+    def _update(self, cell):
+        """Recompute rhs of cell from its neighbors and queue it if it became inconsistent"""
+        maze = self.maze
+        if cell != self.start:
+            g, walls = self.g, maze.openings[cell]
+            best = INFINITE_COST
+            for bit, offset in maze.moves():
+                if walls & bit and g[cell + offset] < best:
+                    best = g[cell + offset]
+            self.rhs[cell] = best if best == INFINITE_COST else best + maze.costs[cell]
+        if self.g[cell] != self.rhs[cell]:
+            heapq.heappush(self.queue, self._key(cell) + (cell,))
+
+    def _top(self):
+        """Key of the first queue entry that is still current, dropping stale ones"""
+        queue, g, rhs = self.queue, self.g, self.rhs
+        while queue:
+            first, second, cell = queue[0]
+            if g[cell] != rhs[cell] and (first, second) == self._key(cell):
+                return first, second
+            heapq.heappop(queue)
+        return INFINITE_COST, INFINITE_COST
+
+    def cells_changed(self, cells):
+        """Maze watcher: walls or costs of these (x, y) cells changed"""
+        size = self.maze.maze_size
+        for x, y in cells:
+            self._update(y * size + x)
+
+    def _compute(self):
+        maze, g, rhs, goal = self.maze, self.g, self.rhs, self.goal
+        self.expanded = 0
+        while self._top() < self._key(goal) or rhs[goal] != g[goal]:
+            if not self.queue:
+                break
+            _, _, cell = heapq.heappop(self.queue)
+            self.expanded += 1
+            walls = maze.openings[cell]
+            if g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+            else:
+                g[cell] = INFINITE_COST
+                self._update(cell)
+            for bit, offset in maze.moves():
+                if walls & bit:
+                    self._update(cell + offset)
+
+    def path(self):
+        """Return (path, cost) for the current maze, ([], None) if the goal is unreachable"""
+        self._compute()
+        maze, g, goal = self.maze, self.g, self.goal
+        if g[goal] == INFINITE_COST:
+            return [], None
+        size = maze.maze_size
+        cells = [goal]
+        current = goal
+        while current != self.start:
+            walls = maze.openings[current]
+            # Step back to a neighbor whose cost plus this cell's cost accounts for g
+            for bit, offset in maze.moves():
+                if walls & bit and g[current + offset] + maze.costs[current] == g[current]:
+                    current += offset
+                    break
+            cells.append(current)
+        cells.reverse()
+        return [(cell % size, cell // size) for cell in cells], g[goal]
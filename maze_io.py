@@ -0,0 +1,77 @@
+"""Compact on-disk maze format, loaded through mmap
+
+Layout, all little-endian:
+    header   magic b'MAZE', uint16 version, uint16 flags, uint32 maze_size
+    walls    maze_size * maze_size bytes of LEFT/RIGHT/UP/DOWN opening bits
+    costs    maze_size * maze_size bytes of cell costs
+"""
+import mmap
+import struct
+
+from maze_engine import Maze
+from maze_topology import MazeTopology
+
+MAGIC = b'MAZE'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+
+# Mapping modes, as in numpy.memmap: read-only, copy-on-write, or write-through
+ACCESS_MODES = {'r': mmap.ACCESS_READ, 'c': mmap.ACCESS_COPY, 'r+': mmap.ACCESS_WRITE}
+
+
+def save_maze(maze, path):
+    """Write the maze's walls and costs to path"""
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, maze.maze_size))
+        file.write(maze.openings)
+        file.write(maze.costs)
+
+
+def read_header(path):
+    """Return maze_size from the header of a saved maze, checking magic and version"""
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+    return _parse_header(header, path)
+
+
+def _parse_header(header, path):
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} is too short to be a maze file")
+    magic, version, _, maze_size = HEADER.unpack(header[:HEADER.size])
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a maze file")
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported maze format version {version}")
+    return maze_size
+
+
+def load_maze(path, mode='r', cell_size=1, renderer=None):
+    """Map a saved maze into memory and wrap it in a Maze without copying its planes
+
+    The walls and costs stay backed by the file, so opening is O(1) and pages
+    are read on demand while solving. mode 'r' maps read-only (solving works,
+    editing walls or costs raises TypeError), 'c' keeps edits private to this
+    process, and 'r+' writes edits back to the file.
+    """
+    if mode not in ACCESS_MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    with open(path, 'r+b' if mode == 'r+' else 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=ACCESS_MODES[mode])
+
+    maze_size = _parse_header(mapped[:HEADER.size], path)
+    cells = maze_size * maze_size
+    if len(mapped) != HEADER.size + 2 * cells:
+        raise ValueError(f"{path} is truncated or has trailing data")
+
+    view = memoryview(mapped)
+    return Maze(
+        maze_size, cell_size, renderer,
+        openings=view[HEADER.size:HEADER.size + cells],
+        costs=view[HEADER.size + cells:],
+    )
+
+
+def load_topology(path):
+    """Map a saved maze read-only and share it as a MazeTopology, again without copying"""
+    maze = load_maze(path, mode='r')
+    return MazeTopology(maze.maze_size, maze.openings, maze.costs)
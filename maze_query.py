@@ -0,0 +1,148 @@
+"""Answer many point-to-point queries on one maze from reusable shortest-path trees"""
+from array import array
+from collections import OrderedDict, deque
+
+from maze_engine import INFINITE_COST, BucketQueue
+
+
+class ShortestPathTree:
+    """Every shortest path out of one source cell, stored as a parent array
+
+    Built once with Dijkstra over cell costs (or BFS with weighted=False);
+    after that path_to and cost_to cost O(path length) and O(1).
+    """
+
+    def __init__(self, maze, source, weighted=True):
+        size = maze.maze_size
+        start, _ = maze.endpoints(source, source)
+        self.maze = maze
+        self.source = source
+        self.weighted = weighted
+        self.distance = array('i', [INFINITE_COST]) * (size * size)
+        self.parent = array('i', [-1]) * (size * size)
+
+        self.distance[start] = 0
+        if weighted:
+            self._dijkstra(start)
+        else:
+            self._bfs(start)
+
+    def _dijkstra(self, start):
+        openings, costs, distance, parent = self.maze.openings, self.maze.costs, self.distance, self.parent
+        moves = self.maze.moves()
+        settled = bytearray(len(distance))
+        frontier = BucketQueue(max(costs))
+        frontier.push(0, start)
+        while frontier:
+            cost, current = frontier.pop()
+            if settled[current]:
+                continue
+            settled[current] = 1
+            walls = openings[current]
+            for bit, offset in moves:
+                if walls & bit:
+                    following = current + offset
+                    new_cost = cost + costs[following]
+                    if new_cost < distance[following]:
+                        distance[following] = new_cost
+                        parent[following] = current
+                        frontier.push(new_cost, following)
+
+    def _bfs(self, start):
+        openings, distance, parent = self.maze.openings, self.distance, self.parent
+        moves = self.maze.moves()
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            walls = openings[current]
+            for bit, offset in moves:
+                if walls & bit:
+                    following = current + offset
+                    if distance[following] == INFINITE_COST:
+                        distance[following] = distance[current] + 1
+                        parent[following] = current
+                        queue.append(following)
+
+    def cost_to(self, target):
+        """Cost of the shortest path from the source to target, or None if unreachable"""
+        _, cell = self.maze.endpoints(self.source, target)
+        cost = self.distance[cell]
+        return None if cost == INFINITE_COST else cost
+
+    def path_to(self, target):
+        """Shortest path from the source to target as (x, y) cells, [] if unreachable"""
+        if self.cost_to(target) is None:
+            return []
+        size = self.maze.maze_size
+        source, current = self.maze.endpoints(self.source, target)
+        path = [tuple(target)]
+        while current != source:
+            current = self.parent[current]
+            path.append((current % size, current // size))
+        path.reverse()
+        return path
+
+
+class QueryEngine:
+    """Shortest-path queries on one maze, reusing cached trees between queries
+
+    Trees are kept for pinned landmark cells plus an LRU of up to capacity
+    recent sources. A query is answered from a tree rooted at either end:
+    entering a cell pays its cost, so a path's cost in the two directions
+    differs only by the two endpoint costs, and the shortest path from the
+    goal, reversed, is also a shortest path from the start.
+    """
+
+    def __init__(self, maze, weighted=True, capacity=16):
+        self.maze = maze
+        self.weighted = weighted
+        self.capacity = capacity
+        self.landmarks = {}
+        self.trees = OrderedDict()
+
+    def add_landmarks(self, cells):
+        """Precompute and pin trees for cells that queries will often start or end at"""
+        for cell in cells:
+            cell = tuple(cell)
+            if cell not in self.landmarks:
+                self.landmarks[cell] = self.trees.pop(cell, None) or ShortestPathTree(self.maze, cell, self.weighted)
+
+    def _cached(self, cell):
+        tree = self.landmarks.get(cell)
+        if tree is None:
+            tree = self.trees.get(cell)
+            if tree is not None:
+                self.trees.move_to_end(cell)
+        return tree
+
+    def tree(self, source):
+        """The shortest-path tree rooted at source, building and caching it when needed"""
+        source = tuple(source)
+        tree = self._cached(source)
+        if tree is None:
+            tree = ShortestPathTree(self.maze, source, self.weighted)
+            self.trees[source] = tree
+            while len(self.trees) > self.capacity:
+                self.trees.popitem(last=False)
+        return tree
+
+    def query(self, start, goal):
+        """Return (path, cost) of a shortest path from start to goal, ([], None) if unreachable"""
+        start, goal = tuple(start), tuple(goal)
+        # Raises ValueError for either end outside the maze
+        self.maze.endpoints(start, goal)
+        tree = self._cached(start)
+        if tree is None:
+            backward = self._cached(goal)
+            if backward is not None:
+                path = backward.path_to(start)[::-1]
+                return path, self._cost(path)
+            tree = self.tree(start)
+        return tree.path_to(goal), tree.cost_to(goal)
+
+    def _cost(self, path):
+        if not path:
+            return None
+        if not self.weighted:
+            return len(path) - 1
+        return self.maze.path_cost(path)
@@ -0,0 +1,547 @@
+import logging
+from collections import OrderedDict
+
+import pygame
+
+from maze_engine import LEFT, RIGHT, UP, DOWN
+
+# Colors
+WHITE = (255, 255, 255)
+GREY = (220, 220, 220)
+DARK_GREY = (120, 120, 120)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+
+# Algorithms that report a cost_map and are drawn with cell costs shaded
+COST_ALGORITHMS = ('UCS', 'ASTAR', 'BIDIR')
+
+# Cells costing at least this much are shaded as expensive, by every renderer
+EXPENSIVE_COST = 2
+
+# How many rendered cost labels MazeRenderer keeps around
+LABEL_CACHE_SIZE = 1024
+
+logger = logging.getLogger(__name__)
+
+
+class MazeRenderer:
+    """Draws a Maze onto a pygame surface; the only place pygame is used for mazes
+
+    The walls and the cost shading never change while a maze is shown, so
+    they are rasterized once into cached layers. Solver steps then redraw
+    only the cells they touch and update just those rects on screen.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        # Pre-rendered static layers for the maze they were built from
+        self._layers = {}
+        self._layers_key = None
+        # What the last full frame showed, and the cell highlighted since then
+        self._frame = None
+        self._highlighted = None
+        # Shared label font and an LRU of rendered label surfaces keyed by value
+        self._font = None
+        self._labels = OrderedDict()
+
+    def _label(self, value):
+        """Return the rendered text surface for a cost label, rendering it at most once"""
+        label = self._labels.get(value)
+        if label is not None:
+            self._labels.move_to_end(value)
+            return label
+        if self._font is None:
+            self._font = pygame.font.SysFont(None, 24)
+        label = self._font.render(str(value), True, BLACK)
+        self._labels[value] = label
+        if len(self._labels) > LABEL_CACHE_SIZE:
+            self._labels.popitem(last=False)
+        return label
+
+    def invalidate(self):
+        """Drop cached layers, e.g. after the maze's walls or costs were edited"""
+        self._layers = {}
+        self._layers_key = None
+        self._frame = None
+
+    def _layer(self, maze, name):
+        """Return the cached static layer called name, building it on first use"""
+        key = (maze, maze.cell_size)
+        if self._layers_key != key:
+            self._layers = {}
+            self._layers_key = key
+        if name not in self._layers:
+            self._layers[name] = getattr(self, f'_build_{name}_layer')(maze)
+        return self._layers[name]
+
+    def _build_walls_layer(self, maze):
+        """Transparent surface with every closed wall drawn once"""
+        cell_size = maze.cell_size
+        pixels = maze.maze_size * cell_size
+        layer = pygame.Surface((pixels + 1, pixels + 1), pygame.SRCALPHA)
+
+        for y in range(maze.maze_size):
+            for x in range(maze.maze_size):
+                walls = maze.openings[y * maze.maze_size + x]
+                # Shared walls are drawn from one side; the outer border from the other
+                if x == 0 and not walls & LEFT:
+                    pygame.draw.line(layer, BLACK, (0, y * cell_size), (0, (y + 1) * cell_size))
+                if y == 0 and not walls & UP:
+                    pygame.draw.line(layer, BLACK, (x * cell_size, 0), ((x + 1) * cell_size, 0))
+                if not walls & RIGHT:
+                    pygame.draw.line(
+                        layer, BLACK,
+                        ((x + 1) * cell_size, y * cell_size),
+                        ((x + 1) * cell_size, (y + 1) * cell_size)
+                    )
+                if not walls & DOWN:
+                    pygame.draw.line(
+                        layer, BLACK,
+                        (x * cell_size, (y + 1) * cell_size),
+                        ((x + 1) * cell_size, (y + 1) * cell_size)
+                    )
+        return layer
+
+    def _build_costs_layer(self, maze):
+        """Opaque surface with every cell shaded by its cost"""
+        cell_size = maze.cell_size
+        layer = pygame.Surface((maze.maze_size * cell_size, maze.maze_size * cell_size))
+        layer.fill(GREY)
+        for index, cost in enumerate(maze.costs):
+            if cost >= EXPENSIVE_COST:
+                x, y = index % maze.maze_size, index // maze.maze_size
+                pygame.draw.rect(layer, DARK_GREY, (x * cell_size, y * cell_size, cell_size, cell_size))
+        return layer
+
+    def _draw_cell(self, maze, cell, show_visited, cost_map, algorithm):
+        """Redraw one cell from scratch and return the screen rect it covers"""
+        x, y = cell
+        cell_size = maze.cell_size
+        index = y * maze.maze_size + x
+        rect = pygame.Rect(x * cell_size, y * cell_size, cell_size, cell_size)
+
+        if algorithm in COST_ALGORITHMS:
+            self.screen.blit(self._layer(maze, 'costs'), rect, area=rect)
+        elif show_visited and maze.is_visited(index):
+            pygame.draw.rect(self.screen, DARK_GREY if maze.costs[index] >= EXPENSIVE_COST else GREY, rect)
+        else:
+            pygame.draw.rect(self.screen, WHITE, rect)
+        if show_visited and cost_map and cell in cost_map:
+            text = self._label(cost_map[cell])
+            self.screen.blit(text, text.get_rect(center=rect.center))
+
+        # One extra pixel picks up the right and bottom walls
+        rect.width += 1
+        rect.height += 1
+        self.screen.blit(self._layer(maze, 'walls'), rect, area=rect)
+        return rect
+
+    def draw_step(self, maze, algorithm, current, show_visited, cost_map=None, delay=0, update=True):
+        """Draw one solver step, updating only the cells that changed since the last one
+
+        Returns the screen rects it drew. With update=False the screen is not
+        updated, so a caller drawing several steps per frame can pass all of
+        their rects to a single pygame.display.update.
+        """
+        if self._frame != (maze, algorithm, show_visited):
+            self.show(maze, show_visited, None, cost_map, algorithm)
+        dirty = []
+        if self._highlighted is not None and self._highlighted != current:
+            dirty.append(self._draw_cell(maze, self._highlighted, show_visited, cost_map, algorithm))
+
+        x, y = current
+        rect = pygame.Rect(x * maze.cell_size, y * maze.cell_size, maze.cell_size, maze.cell_size)
+        pygame.draw.rect(self.screen, GREEN, rect)
+        dirty.append(rect)
+        self._highlighted = current
+
+        if update:
+            pygame.display.update(dirty)
+        pygame.time.delay(delay)
+        return dirty
+
+    def replay(self, maze, events, show_visited=True, delay=0):
+        """Animate a recorded sequence of SearchEvents, e.g. one logged from a headless run"""
+        cost_map = {}
+        for event in events:
+            x, y = event.cell
+            maze.marks[y * maze.maze_size + x] = maze.epoch
+            if event.cost is not None:
+                cost_map[event.cell] = event.cost
+            self.draw_step(maze, event.algorithm, event.cell, show_visited, cost_map or None, delay)
+
+    def show(self, maze, show_visited=False, current=None, cost_map=None, algorithm=None):
+        screen = self.screen
+        cell_size = maze.cell_size
+
+        if algorithm in COST_ALGORITHMS:
+            screen.blit(self._layer(maze, 'costs'), (0, 0))
+
+        # Draw visited cells
+        if show_visited:
+            marks, epoch = maze.marks, maze.epoch
+            index = marks.find(epoch)
+            while index != -1:
+                x, y = index % maze.maze_size, index // maze.maze_size
+                pygame.draw.rect(
+                    screen,
+                    DARK_GREY if maze.costs[index] >= EXPENSIVE_COST else GREY,
+                    (x * cell_size, y * cell_size, cell_size, cell_size)
+                )
+                index = marks.find(epoch, index + 1)
+
+        # Draw cost values on cells if cost_map is provided
+        if show_visited and cost_map:
+            for (x, y), cost in cost_map.items():
+                text = self._label(cost)
+                text_rect = text.get_rect(
+                    center=(
+                        x * cell_size + cell_size // 2,
+                        y * cell_size + cell_size // 2,
+                    )
+                )
+                screen.blit(text, text_rect)
+
+        # Draw maze walls
+        screen.blit(self._layer(maze, 'walls'), (0, 0))
+
+        self._frame = (maze, algorithm, show_visited)
+        self._highlighted = None
+
+        # Highlight the current cell for UCS or other cost-aware algorithms
+        if (algorithm in COST_ALGORITHMS) and current:
+            logger.debug("Highlighting %s", current)
+
+            # Ensure current is a tuple with exactly two numeric values
+            if len(current) != 2:
+                logger.warning("Invalid current state: %s", current)
+                return
+
+            cx, cy = current  # Only unpack two values
+
+            try:
+                cx = int(cx)
+                cy = int(cy)
+            except ValueError:
+                logger.warning("Invalid coordinate: cx = %s, cy = %s", cx, cy)
+                return  # Skip this iteration if coordinates are invalid
+
+            logger.debug("cx: %d, cy: %d, cell_size: %d", cx, cy, cell_size)
+
+            pygame.draw.rect(
+                screen, GREEN,
+                (cx * cell_size, cy * cell_size, cell_size, cell_size),
+                width=3
+            )
+
+        # Highlight the path
+        if algorithm:
+            for x, y in maze.path[algorithm]:
+                pygame.draw.circle(
+                    screen,
+                    BLUE,
+                    (x * cell_size + cell_size // 2, y * cell_size + cell_size // 2),
+                    cell_size // 8
+                )
+
+        pygame.display.update()
+
+    def display_saved_path(self, maze, algorithm, cost_map=None):
+        screen = self.screen
+        cell_size = maze.cell_size
+
+        if algorithm in maze.path and maze.path[algorithm]:
+
+                for x, y in maze.path[algorithm]:
+                    # Draw the path circle
+                    pygame.draw.circle(
+                        screen,
+                        BLUE,
+                        (x * cell_size + cell_size // 2, y * cell_size + cell_size // 2),
+                        cell_size // 8
+                    )
+
+                    # Draw the cost on the path (if a cost map is available)
+                    if algorithm in COST_ALGORITHMS and cost_map and (x, y) in cost_map:
+                        text = self._label(cost_map[(x, y)])
+                        text_rect = text.get_rect(
+                            center=(
+                                x * cell_size + cell_size // 2,
+                                y * cell_size + cell_size // 2,
+                            )
+                        )
+                        screen.blit(text, text_rect)
+
+                pygame.display.update()
+        else:
+            logger.warning("No path saved for %s.", algorithm)
+        self._frame = None
+
+
+# Pixels per cell a MazeViewport can zoom between
+ZOOM_LEVELS = (1, 2, 4, 8, 16, 32)
+# Side of one cached viewport tile in pixels, whatever the zoom
+TILE_PIXELS = 256
+# Cached tiles kept by a MazeViewport; at 256x256 pixels that is up to 64 MiB
+TILE_CACHE_SIZE = 256
+# Default overlay colors, translucent so the maze shows through
+VISITED_OVERLAY = (0, 0, 255, 60)
+PATH_OVERLAY = (255, 0, 0, 160)
+
+
+def _pattern_rows(floor, shaded, wall):
+    """Two-pixels-per-cell lookup tables: (top, bottom) pixel pairs by [shaded][walls]
+
+    Each cell is a floor pixel with its right and bottom walls beside it;
+    _build_base_tile adds the maze's outer left and top borders itself.
+    """
+    tops, bottoms = [], []
+    for color in (floor, shaded):
+        tops.append([bytes(color) + bytes(color if walls & RIGHT else wall) for walls in range(256)])
+        bottoms.append([bytes(color if walls & DOWN else wall) + bytes(wall) for walls in range(256)])
+    return tops, bottoms
+
+
+class MazeViewport:
+    """Scrollable, zoomable view of a maze of any size, drawn from cached tiles
+
+    The maze is cut into tiles of TILE_PIXELS square at each zoom level and
+    a tile is rasterized the first time it becomes visible, then kept in an
+    LRU. A frame only blits the visible tiles. Overlays such as the visited
+    cells or a path live on their own transparent tiles, so changing one
+    never re-rasterizes the walls. At 1 and 2 pixels per cell the walls are
+    drawn as a two-pixel-per-cell bitmap, scaled down for zoom 1.
+    """
+
+    def __init__(self, screen, maze, zoom=None):
+        self.screen = screen
+        self.maze = maze
+        if zoom is None:
+            # Largest zoom that still fits the whole maze, or the smallest one
+            fitting = [level for level in ZOOM_LEVELS if level * maze.maze_size <= min(screen.get_size())]
+            zoom = fitting[-1] if fitting else ZOOM_LEVELS[0]
+        self.zoom = zoom
+        # Scroll position: the maze pixel (at the current zoom) shown at the screen's top-left
+        self.left = 0
+        self.top = 0
+        self._tiles = OrderedDict()
+        self._overlays = OrderedDict()
+        self._patterns = _pattern_rows(WHITE, GREY, BLACK)
+
+    # ---- Overlays ----
+
+    def set_overlay(self, name, cells, color=PATH_OVERLAY):
+        """Show (x, y) cells in color on an overlay called name, replacing any previous one"""
+        size = self.maze.maze_size
+        previous = self._overlays.pop(name, None)
+        self._drop_overlay_tiles(name)
+        self._overlays[name] = {
+            'color': color,
+            'cells': {y * size + x for x, y in cells},
+            'version': previous['version'] + 1 if previous else 0,
+            'buckets': {},
+        }
+
+    def show_visited(self, color=VISITED_OVERLAY):
+        """Overlay the maze's visited cells; call refresh('visited') as a search marks more"""
+        previous = self._overlays.pop('visited', None)
+        self._drop_overlay_tiles('visited')
+        self._overlays['visited'] = {
+            'color': color,
+            'cells': None,
+            'version': previous['version'] + 1 if previous else 0,
+        }
+
+    def refresh(self, name):
+        """Redraw overlay name on the next frame after its cells changed"""
+        overlay = self._overlays[name]
+        overlay['version'] += 1
+        overlay['buckets'] = {}
+        self._drop_overlay_tiles(name)
+
+    def clear_overlay(self, name):
+        self._overlays.pop(name, None)
+        self._drop_overlay_tiles(name)
+
+    def _drop_overlay_tiles(self, name):
+        """Evict overlay name's cached tiles, which a new version or epoch can never hit again
+
+        Left in the LRU they would push out still-valid wall tiles, and the
+        GUI refreshes the visited overlay on every frame a search advances.
+        """
+        for key in [key for key in self._tiles if key[0] == name]:
+            del self._tiles[key]
+
+    def invalidate(self):
+        """Drop every cached tile, e.g. after the maze's walls or costs were edited"""
+        self._tiles.clear()
+
+    # ---- Navigation ----
+
+    def scroll(self, dx, dy):
+        """Move the view by dx, dy screen pixels, staying within the maze"""
+        width, height = self.screen.get_size()
+        extent = self.maze.maze_size * self.zoom
+        self.left = max(0, min(self.left + dx, extent - width))
+        self.top = max(0, min(self.top + dy, extent - height))
+
+    def zoom_at(self, steps, position):
+        """Zoom in (steps > 0) or out by whole levels, keeping the cell under position still"""
+        index = max(0, min(ZOOM_LEVELS.index(self.zoom) + steps, len(ZOOM_LEVELS) - 1))
+        zoom = ZOOM_LEVELS[index]
+        px, py = position
+        cell_x, cell_y = (self.left + px) / self.zoom, (self.top + py) / self.zoom
+        self.zoom = zoom
+        self.left, self.top = int(cell_x * zoom - px), int(cell_y * zoom - py)
+        self.scroll(0, 0)
+
+    def handle_event(self, event):
+        """Scroll on drag or arrow keys and zoom on the mouse wheel; True if the view changed"""
+        if event.type == pygame.MOUSEWHEEL:
+            self.zoom_at(event.y, pygame.mouse.get_pos())
+        elif event.type == pygame.MOUSEMOTION and event.buttons[0]:
+            self.scroll(-event.rel[0], -event.rel[1])
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN):
+            step = TILE_PIXELS // 4
+            self.scroll(
+                {pygame.K_LEFT: -step, pygame.K_RIGHT: step}.get(event.key, 0),
+                {pygame.K_UP: -step, pygame.K_DOWN: step}.get(event.key, 0),
+            )
+        else:
+            return False
+        return True
+
+    # ---- Drawing ----
+
+    def draw(self, update=True):
+        """Blit the visible base and overlay tiles, then update the screen unless update is False"""
+        width, height = self.screen.get_size()
+        zoom, size = self.zoom, self.maze.maze_size
+        span = max(1, TILE_PIXELS // zoom)
+        tiles_across = -(-size // span)
+        self.screen.fill(DARK_GREY)
+
+        first_x, first_y = self.left // TILE_PIXELS, self.top // TILE_PIXELS
+        last_x = min((self.left + width - 1) // TILE_PIXELS, tiles_across - 1)
+        last_y = min((self.top + height - 1) // TILE_PIXELS, tiles_across - 1)
+        for tile_y in range(first_y, last_y + 1):
+            for tile_x in range(first_x, last_x + 1):
+                position = (tile_x * TILE_PIXELS - self.left, tile_y * TILE_PIXELS - self.top)
+                self.screen.blit(self._tile(('base', zoom, tile_x, tile_y), self._build_base_tile), position)
+                for name, overlay in self._overlays.items():
+                    key = (name, overlay['version'], self.maze.epoch, zoom, tile_x, tile_y)
+                    tile = self._tile(key, self._build_overlay_tile)
+                    if tile is not None:
+                        self.screen.blit(tile, position)
+        if update:
+            pygame.display.update()
+
+    def _tile(self, key, build):
+        """Cached tile for key, built by build(key) on a miss; None is cached too"""
+        if key in self._tiles:
+            self._tiles.move_to_end(key)
+            return self._tiles[key]
+        tile = build(key)
+        self._tiles[key] = tile
+        while len(self._tiles) > TILE_CACHE_SIZE:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def _tile_cells(self, zoom, tile_x, tile_y):
+        """(x0, y0, columns, rows) of the cells a tile covers"""
+        size = self.maze.maze_size
+        span = max(1, TILE_PIXELS // zoom)
+        x0, y0 = tile_x * span, tile_y * span
+        return x0, y0, min(span, size - x0), min(span, size - y0)
+
+    def _build_base_tile(self, key):
+        _, zoom, tile_x, tile_y = key
+        maze = self.maze
+        size, openings, costs = maze.maze_size, maze.openings, maze.costs
+        x0, y0, columns, rows = self._tile_cells(zoom, tile_x, tile_y)
+
+        if zoom < 4:
+            # Each cell is a floor pixel with its right and bottom walls beside it
+            tops, bottoms = self._patterns
+            wall = bytes(BLACK)
+            lines = []
+            for y in range(y0, y0 + rows):
+                start = y * size + x0
+                pairs = list(zip(costs[start:start + columns], openings[start:start + columns]))
+                top = b''.join(tops[cost >= EXPENSIVE_COST][walls] for cost, walls in pairs)
+                bottom = b''.join(bottoms[cost >= EXPENSIVE_COST][walls] for cost, walls in pairs)
+                # The outer borders cover the first column's and row's floor pixels, as at larger zooms
+                if x0 == 0 and not openings[start] & LEFT:
+                    top, bottom = wall + top[3:], wall + bottom[3:]
+                if y == 0:
+                    top = b''.join(
+                        top[6 * column:6 * column + 6] if walls & UP else wall * 2
+                        for column, (_, walls) in enumerate(pairs)
+                    )
+                lines.append(top)
+                lines.append(bottom)
+            tile = pygame.image.frombuffer(b''.join(lines), (2 * columns, 2 * rows), 'RGB').copy()
+            if zoom == 1:
+                tile = pygame.transform.smoothscale(tile, (columns, rows))
+            return tile
+
+        tile = pygame.Surface((columns * zoom, rows * zoom))
+        tile.fill(WHITE)
+        for y in range(y0, y0 + rows):
+            top = (y - y0) * zoom
+            for x in range(x0, x0 + columns):
+                left = (x - x0) * zoom
+                cell = y * size + x
+                walls = openings[cell]
+                if costs[cell] >= EXPENSIVE_COST:
+                    tile.fill(GREY, (left, top, zoom, zoom))
+                # Walls sit on the inside edge of their cell, so tiles never draw into each other
+                if not walls & RIGHT:
+                    tile.fill(BLACK, (left + zoom - 1, top, 1, zoom))
+                if not walls & DOWN:
+                    tile.fill(BLACK, (left, top + zoom - 1, zoom, 1))
+                if x == 0 and not walls & LEFT:
+                    tile.fill(BLACK, (left, top, 1, zoom))
+                if y == 0 and not walls & UP:
+                    tile.fill(BLACK, (left, top, zoom, 1))
+        return tile
+
+    def _build_overlay_tile(self, key):
+        name, _, _, zoom, tile_x, tile_y = key
+        overlay = self._overlays[name]
+        size = self.maze.maze_size
+        x0, y0, columns, rows = self._tile_cells(zoom, tile_x, tile_y)
+
+        if overlay['cells'] is None:
+            # Visited cells come straight from the maze's epoch marks, as a one-pixel-per-cell
+            # palette mask scaled up to the zoom, so a search can refresh it every frame
+            marks, epoch = self.maze.marks, self.maze.epoch
+            mask = b''.join(marks[y * size + x0:y * size + x0 + columns] for y in range(y0, y0 + rows))
+            mask = mask.translate(bytes(1 if mark == epoch else 0 for mark in range(256)))
+            if 1 not in mask:
+                return None
+            tile = pygame.image.frombuffer(mask, (columns, rows), 'P')
+            tile = pygame.transform.scale(tile, (columns * zoom, rows * zoom))
+            tile.set_palette_at(1, overlay['color'][:3])
+            tile.set_colorkey(0)
+            # Per-pixel alpha blits fastest; fold the overlay's translucency into it
+            tile = tile.convert_alpha()
+            tile.fill((255, 255, 255, overlay['color'][3]), special_flags=pygame.BLEND_RGBA_MULT)
+            return tile
+
+        span = max(1, TILE_PIXELS // zoom)
+        buckets = overlay['buckets'].get(zoom)
+        if buckets is None:
+            buckets = overlay['buckets'][zoom] = {}
+            for cell in overlay['cells']:
+                buckets.setdefault((cell % size // span, cell // size // span), []).append(cell)
+        cells = buckets.get((tile_x, tile_y), [])
+
+        if not cells:
+            return None
+        tile = pygame.Surface((columns * zoom, rows * zoom), pygame.SRCALPHA)
+        for cell in cells:
+            tile.fill(overlay['color'], ((cell % size - x0) * zoom, (cell // size - y0) * zoom, zoom, zoom))
+        return tile
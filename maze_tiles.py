@@ -0,0 +1,295 @@
+"""Tiled mazes for grids larger than memory, generated and solved tile by tile
+
+Layout, all little-endian:
+    header   magic b'MAZT', uint16 version, uint16 flags, uint32 maze_size, uint32 tile_size
+    tiles    ceil(maze_size / tile_size) ** 2 tiles in row-major order, each
+             tile_size * tile_size wall bytes then as many cost bytes, with the
+             edge tiles padded out to full size
+
+generate_tiled() streams a maze into such a file with Eller's algorithm,
+which only keeps one row of state. TiledMaze reads tiles on demand into an
+LRU of resident tiles, so memory is bounded by the LRU capacity plus the
+search state of whatever is being solved.
+"""
+import heapq
+import random
+import struct
+from collections import OrderedDict, deque
+
+from maze_engine import COST_PROBABILITY, DOWN, LEFT, RIGHT, UP, Maze, SearchStats
+
+MAGIC = b'MAZT'
+VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+
+DEFAULT_TILE_SIZE = 256
+# Resident tiles kept by TiledMaze; 64 tiles of 256x256 cells is 8 MiB
+DEFAULT_CAPACITY = 64
+
+# Algorithms TiledMaze.solve understands
+ALGORITHMS = ('BFS', 'UCS', 'ASTAR')
+
+
+def is_tiled(path):
+    """True if path starts with the tiled maze magic"""
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def generate_tiled(path, maze_size, tile_size=DEFAULT_TILE_SIZE, seed=None, loops=0.0,
+                   cost_probability=COST_PROBABILITY):
+    """Write a perfect maze of maze_size x maze_size cells to path, one band of tiles at a time
+
+    Eller's algorithm carves row by row, tracking only which cells of the
+    current row are already connected. loops is the chance of also opening
+    a wall between two cells that are already connected, which adds cycles.
+    Memory is O(maze_size * tile_size) for the band being filled.
+    """
+    rng = random.Random(seed)
+    across = -(-maze_size // tile_size)
+    tile_cells = tile_size * tile_size
+    width = across * tile_size
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, maze_size, tile_size))
+        file.truncate(HEADER.size + across * across * 2 * tile_cells)
+
+        # Set id of every cell in the current row; cells sharing an id are connected
+        sets = list(range(maze_size))
+        next_set = maze_size
+        down = bytearray(maze_size)
+        for band in range(across):
+            walls = bytearray(tile_size * width)
+            costs = bytearray(tile_size * width)
+            for row in range(tile_size):
+                y = band * tile_size + row
+                if y >= maze_size:
+                    break
+                last = y == maze_size - 1
+                base = row * width
+                # Walls opened down from the previous row
+                for x in range(maze_size):
+                    if down[x]:
+                        walls[base + x] |= UP
+                    costs[base + x] = 2 if rng.random() < cost_probability else 1
+
+                # Join neighbors across the row; the last row must join every remaining set
+                merged = {}
+                for x in range(maze_size - 1):
+                    left, right = _find(merged, sets[x]), _find(merged, sets[x + 1])
+                    if left != right:
+                        join = last or rng.random() < 0.5
+                    else:
+                        join = not last and rng.random() < loops
+                    if join:
+                        walls[base + x] |= RIGHT
+                        walls[base + x + 1] |= LEFT
+                        if left != right:
+                            merged[right] = left
+                sets = [_find(merged, cell_set) for cell_set in sets]
+
+                down = bytearray(maze_size)
+                if not last:
+                    # Every set continues down through at least one of its cells
+                    members = {}
+                    for x, cell_set in enumerate(sets):
+                        members.setdefault(cell_set, []).append(x)
+                    for cells in members.values():
+                        chosen = [x for x in cells if rng.random() < 0.5] or [rng.choice(cells)]
+                        for x in chosen:
+                            down[x] = 1
+                            walls[base + x] |= DOWN
+                    for x in range(maze_size):
+                        if not down[x]:
+                            sets[x] = next_set
+                            next_set += 1
+
+            for column in range(across):
+                file.seek(HEADER.size + (band * across + column) * 2 * tile_cells)
+                start = column * tile_size
+                for plane in (walls, costs):
+                    file.write(b''.join(
+                        plane[row * width + start:row * width + start + tile_size] for row in range(tile_size)
+                    ))
+
+
+def _find(merged, cell_set):
+    """Representative of cell_set in this row's merges, compressing the path behind it"""
+    root = cell_set
+    while root in merged:
+        root = merged[root]
+    while cell_set in merged and merged[cell_set] != root:
+        merged[cell_set], cell_set = root, merged[cell_set]
+    return root
+
+
+class TiledMaze:
+    """Read-only view of a tiled maze file that keeps at most capacity tiles in memory
+
+    Tiles are read with plain positioned reads rather than mmap, so resident
+    memory is bounded by the LRU instead of by how much of the file the OS
+    page cache decides to keep mapped. loads and evictions count tile traffic.
+    """
+
+    def __init__(self, path, capacity=DEFAULT_CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        self.file = open(path, 'rb')
+        header = self.file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            self.file.close()
+            raise ValueError(f"{path} is too short to be a tiled maze file")
+        magic, version, _, self.maze_size, self.tile_size = HEADER.unpack(header)
+        if magic != MAGIC:
+            self.file.close()
+            raise ValueError(f"{path} is not a tiled maze file")
+        if version != VERSION:
+            self.file.close()
+            raise ValueError(f"{path} has unsupported tiled maze format version {version}")
+        self.across = -(-self.maze_size // self.tile_size)
+        self.tile_cells = self.tile_size * self.tile_size
+        self.tiles = OrderedDict()
+        self.loads = 0
+        self.evictions = 0
+        # SearchStats of the latest run of each algorithm
+        self.stats = {algorithm: None for algorithm in ALGORITHMS}
+
+    def close(self):
+        self.file.close()
+        self.tiles.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def tile(self, index):
+        """Walls then costs of tile index, reading it in and evicting the oldest tile if needed"""
+        tile = self.tiles.get(index)
+        if tile is not None:
+            self.tiles.move_to_end(index)
+            return tile
+        tile = bytearray(2 * self.tile_cells)
+        self.file.seek(HEADER.size + index * 2 * self.tile_cells)
+        self.file.readinto(tile)
+        self.loads += 1
+        self.tiles[index] = tile
+        while len(self.tiles) > self.capacity:
+            self.tiles.popitem(last=False)
+            self.evictions += 1
+        return tile
+
+    def cell(self, x, y):
+        """(walls, cost) of cell (x, y)"""
+        size = self.tile_size
+        tile = self.tile((y // size) * self.across + x // size)
+        index = (y % size) * size + x % size
+        return tile[index], tile[self.tile_cells + index]
+
+    def solve(self, algorithm='ASTAR', start=(0, 0), goal=None):
+        """Shortest path from start to goal as (x, y) cells, [] if unreachable
+
+        BFS minimizes steps, UCS and ASTAR the summed cell cost. Search state
+        lives in dicts holding only the cells reached, so it grows with the
+        explored region rather than with the maze; A* explores the least.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        maze_size = self.maze_size
+        if goal is None:
+            goal = (maze_size - 1, maze_size - 1)
+        for x, y in (start, goal):
+            if not (0 <= x < maze_size and 0 <= y < maze_size):
+                raise ValueError(f"Cell ({x}, {y}) is outside the {maze_size}x{maze_size} maze")
+
+        stats = SearchStats(algorithm)
+        size, across, tile_cells = self.tile_size, self.across, self.tile_cells
+        tile_index, tile = -1, None
+        goal_x, goal_y = goal
+        moves = ((LEFT, -1, 0), (RIGHT, 1, 0), (UP, 0, -1), (DOWN, 0, 1))
+        parent = {start: None}
+        expanded, generated, peak_frontier = 0, 1, 1
+
+        if algorithm == 'BFS':
+            queue = deque([start])
+            while queue:
+                if len(queue) > peak_frontier:
+                    peak_frontier = len(queue)
+                current = queue.popleft()
+                expanded += 1
+                if current == goal:
+                    break
+                x, y = current
+                index = (y // size) * across + x // size
+                if index != tile_index:
+                    tile_index, tile = index, self.tile(index)
+                walls = tile[(y % size) * size + x % size]
+                for bit, dx, dy in moves:
+                    following = (x + dx, y + dy)
+                    if walls & bit and following not in parent:
+                        parent[following] = current
+                        queue.append(following)
+                        generated += 1
+        else:
+            distance = {start: 0}
+            settled = set()
+            queue = [(0, 0, start)]
+            while queue:
+                if len(queue) > peak_frontier:
+                    peak_frontier = len(queue)
+                _, cost, current = heapq.heappop(queue)
+                if current in settled:
+                    continue
+                settled.add(current)
+                expanded += 1
+                if current == goal:
+                    break
+                x, y = current
+                index = (y // size) * across + x // size
+                if index != tile_index:
+                    tile_index, tile = index, self.tile(index)
+                walls = tile[(y % size) * size + x % size]
+                for bit, dx, dy in moves:
+                    if not walls & bit:
+                        continue
+                    nx, ny = x + dx, y + dy
+                    # Neighbors can sit in the next tile over
+                    index = (ny // size) * across + nx // size
+                    if index != tile_index:
+                        tile_index, tile = index, self.tile(index)
+                    new_cost = cost + tile[tile_cells + (ny % size) * size + nx % size]
+                    following = (nx, ny)
+                    if new_cost < distance.get(following, new_cost + 1):
+                        distance[following] = new_cost
+                        parent[following] = current
+                        estimate = abs(goal_x - nx) + abs(goal_y - ny) if algorithm == 'ASTAR' else 0
+                        heapq.heappush(queue, (new_cost + estimate, new_cost, following))
+                        generated += 1
+
+        path = []
+        if goal in parent:
+            current = goal
+            while current is not None:
+                path.append(current)
+                current = parent[current]
+            path.reverse()
+        stats.finish(expanded, generated, peak_frontier, len(path),
+                     sum(self.cell(x, y)[1] for x, y in path[1:]) if path else None)
+        self.stats[algorithm] = stats
+        return path
+
+    def to_maze(self):
+        """Copy the whole grid into an ordinary Maze; only for mazes that fit in memory"""
+        maze_size, size = self.maze_size, self.tile_size
+        openings = bytearray(maze_size * maze_size)
+        costs = bytearray(maze_size * maze_size)
+        for tile_y in range(self.across):
+            for tile_x in range(self.across):
+                tile = self.tile(tile_y * self.across + tile_x)
+                width = min(size, maze_size - tile_x * size)
+                for row in range(min(size, maze_size - tile_y * size)):
+                    target = (tile_y * size + row) * maze_size + tile_x * size
+                    openings[target:target + width] = tile[row * size:row * size + width]
+                    costs[target:target + width] = tile[self.tile_cells + row * size:self.tile_cells + row * size + width]
+        return Maze(maze_size, openings=openings, costs=costs)
@@ -0,0 +1,55 @@
+"""Read-only maze topology that many threads can solve against at once"""
+from maze_engine import SOLVERS, Maze
+
+
+class MazeTopology:
+    """Immutable walls and costs of a maze, shared by every solve request
+
+    Buffers are kept as bytes or read-only memoryviews, so nothing can edit
+    them after construction. Each solve() builds a throwaway Maze over the
+    shared buffers to hold that request's marks, path and stats; solvers
+    keep the rest of their state in locals, so concurrent solves from a
+    thread pool never see each other's work.
+    """
+
+    __slots__ = ('maze_size', 'openings', 'costs')
+
+    def __init__(self, maze_size, openings, costs):
+        if len(openings) != maze_size * maze_size or len(costs) != maze_size * maze_size:
+            raise ValueError(f"Buffers do not match a {maze_size}x{maze_size} maze")
+        self.maze_size = maze_size
+        self.openings = self._frozen(openings)
+        self.costs = self._frozen(costs)
+
+    def __setattr__(self, name, value):
+        # Each slot can be filled once, in __init__
+        if hasattr(self, name):
+            raise AttributeError(f"MazeTopology is read-only; cannot set {name}")
+        object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _frozen(buffer):
+        # Read-only views (e.g. a mapping opened with mode 'r') are shared without a copy
+        if isinstance(buffer, memoryview) and buffer.readonly:
+            return buffer
+        return bytes(buffer)
+
+    @classmethod
+    def from_maze(cls, maze):
+        """Snapshot a maze's current walls and costs"""
+        return cls(maze.maze_size, maze.openings, maze.costs)
+
+    def maze(self):
+        """A fresh Maze over the shared buffers, holding per-request state only"""
+        return Maze(self.maze_size, openings=self.openings, costs=self.costs)
+
+    def solve(self, algorithm, **options):
+        """Run one solve request; returns (path, SearchStats) and touches no shared state
+
+        options are passed to the solver as in Maze.solve, e.g. start and goal.
+        """
+        if algorithm not in SOLVERS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        maze = self.maze()
+        path = maze.solve(algorithm, **options)
+        return path, maze.stats[algorithm]